@@ -0,0 +1,367 @@
+"""Análisis de delitos de una comuna, sin Streamlit.
+
+Cada función recibe un DatosComuna explícito y devuelve un resultado tipado (NamedTuple) con
+totales, variaciones, periodos de mayor y menor frecuencia, promedios por trimestre y
+proyecciones; el formato (HTML, tarjetas, reportes) queda en quien lo presenta. Así los
+análisis se pueden calcular en lote, cachear y medir fuera del proceso del dashboard:
+
+    datos = DatosComuna.cargar(1101)
+    resumen_mensual(datos, "HOMICIDIOS Y FEMICIDIOS").variacion.porcentaje
+"""
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from cube import MESES, totales_mensuales
+
+TRIMESTRES = ("Q1 (Ene-Mar)", "Q2 (Abr-Jun)", "Q3 (Jul-Sep)", "Q4 (Oct-Dic)")
+
+# Semanas (desde, hasta) de cada trimestre
+SEMANAS_TRIMESTRE = ((1, 13), (14, 26), (27, 39), (40, 52))
+
+# Delitos de las métricas fijas, con el nombre exacto de la fuente
+HOMICIDIOS = "HOMICIDIOS Y FEMICIDIOS"
+ROBOS_VIOLENCIA = "ROBOS CON VIOLENCIA E INTIMIDACIÓN"
+
+
+class Variacion(NamedTuple):
+    """Cambio de `anterior` a `actual`; porcentaje es None si anterior no es positivo"""
+    anterior: float
+    actual: float
+    porcentaje: Optional[float]
+
+
+class Periodo(NamedTuple):
+    """Un mes (por nombre) o una semana (por número) con su frecuencia"""
+    periodo: object
+    valor: float
+
+
+class Extremos(NamedTuple):
+    """Periodos de mayor y menor frecuencia (el primero en caso de empate)"""
+    mayor: Periodo
+    menor: Periodo
+
+
+class DelitoTotal(NamedTuple):
+    delito: str
+    total: float
+
+
+class Trimestre(NamedTuple):
+    """Promedio por mes o por semana de un trimestre; None si el año no tiene datos en él"""
+    nombre: str
+    anterior: Optional[float]
+    actual: Optional[float]
+    porcentaje: Optional[float]
+
+
+class Proyeccion(NamedTuple):
+    """Casos por mes esperados para el resto del año actual, desde el mes `desde`"""
+    desde: str
+    promedio: float
+
+
+class ResumenAnual(NamedTuple):
+    totales: dict
+    # Variación de cada año respecto del año previo con datos: {año: Variacion}
+    variaciones: dict
+
+
+class ResumenMensual(NamedTuple):
+    anterior: list
+    actual: list
+    # Meses completos del año actual contra los mismos meses del anterior
+    variacion: Variacion
+    extremos_anterior: Extremos
+    extremos_actual: Optional[Extremos]
+    # {mes: porcentaje} de los meses comparables con casos el año anterior
+    variaciones: dict
+    mayor_aumento: Optional[Periodo]
+    mayor_disminucion: Optional[Periodo]
+    trimestres: list
+    proyeccion: Optional[Proyeccion]
+
+
+class ResumenSemanal(NamedTuple):
+    anterior: dict
+    actual: dict
+    variacion: Variacion
+    extremos_anterior: Optional[Extremos]
+    extremos_actual: Optional[Extremos]
+    semanas_comunes: int
+    variaciones: dict
+    mayor_aumento: Optional[Periodo]
+    mayor_disminucion: Optional[Periodo]
+    # Solo los trimestres con datos en alguno de los dos años
+    trimestres: list
+
+
+class ResumenGeneral(NamedTuple):
+    totales: dict
+    # Como ResumenAnual.variaciones, para el total de delitos
+    tendencias: dict
+    mas_frecuente: DelitoTotal
+    menos_frecuente: DelitoTotal
+    extremos_mensuales_anterior: Extremos
+    extremos_mensuales_actual: Optional[Extremos]
+    homicidios_semana12: int
+
+
+class MetricasClave(NamedTuple):
+    total_anterior: float
+    total_actual: float
+    mas_frecuente_anterior: DelitoTotal
+    mas_frecuente_actual: DelitoTotal
+    # Año actual contra el mismo periodo del anterior, y año anterior contra el previo
+    variacion_mismo_periodo: Variacion
+    variacion_anual: Variacion
+    robos_violencia_mes_corte: Periodo
+    homicidios_semana12: int
+
+
+class DatosComuna:
+    """Datos de una comuna para los análisis: periodos, tabla anual, tabla mensual y matrices.
+
+    `matriz(delito, granularidad)` devuelve la MatrizPeriodos (año × mes o año × semana) de un
+    delito o de "All"; granularidad es "mensual" o "semanal"
+    """
+
+    def __init__(self, codcom, periodos, annual_df, monthly_df, matriz):
+        self.codcom = codcom
+        self.periodos = periodos
+        self.annual_df = annual_df
+        self.monthly_df = monthly_df
+        self._matriz = matriz
+
+    @classmethod
+    def cargar(cls, codcom, tablas=None):
+        """Datos de la comuna leídos del cubo del proceso (data y queries); `tablas` son las
+        (annual_df, monthly_df, weekly_df) de get_data si ya están a mano"""
+        import queries
+        from data import get_data, get_periodos
+
+        annual_df, monthly_df, _ = tablas if tablas is not None else get_data(codcom)
+
+        def matriz(delito, granularidad):
+            consulta = queries.matriz_mensual if granularidad == "mensual" else queries.matriz_semanal
+            return consulta(codcom, delito)
+
+        return cls(codcom, get_periodos(), annual_df, monthly_df, matriz)
+
+    def mensual(self, delito="All"):
+        return self._matriz(delito, "mensual")
+
+    def semanal(self, delito="All"):
+        return self._matriz(delito, "semanal")
+
+
+def nativo(valor):
+    """int o float de Python en lugar de un escalar de NumPy, así los resultados pasan por json.dumps"""
+    return int(valor) if isinstance(valor, (int, np.integer)) else float(valor)
+
+
+def variacion(anterior, actual):
+    anterior, actual = nativo(anterior), nativo(actual)
+    porcentaje = (actual - anterior) / anterior * 100 if anterior > 0 else None
+    return Variacion(anterior, actual, porcentaje)
+
+
+def extremos(valores, periodos):
+    """Extremos de una secuencia de valores con la etiqueta de cada posición"""
+    mayor, menor = int(np.argmax(valores)), int(np.argmin(valores))
+    return Extremos(Periodo(periodos[mayor], nativo(valores[mayor])), Periodo(periodos[menor], nativo(valores[menor])))
+
+
+def extremos_serie(serie):
+    """Extremos de un {periodo: valor}; None si está vacío"""
+    if not serie:
+        return None
+    mayor, menor = max(serie, key=serie.get), min(serie, key=serie.get)
+    return Extremos(Periodo(mayor, nativo(serie[mayor])), Periodo(menor, nativo(serie[menor])))
+
+
+def _aumento_y_disminucion(variaciones):
+    if not variaciones:
+        return None, None
+    mayor, menor = max(variaciones, key=variaciones.get), min(variaciones, key=variaciones.get)
+    return Periodo(mayor, float(variaciones[mayor])), Periodo(menor, float(variaciones[menor]))
+
+
+def _mas_y_menos_frecuente(annual_df, columna):
+    frecuencias = annual_df[['Delito', columna]].sort_values(columna, ascending=False)
+    primero, ultimo = frecuencias.iloc[0], frecuencias.iloc[-1]
+    return DelitoTotal(str(primero['Delito']), nativo(primero[columna])), DelitoTotal(str(ultimo['Delito']), nativo(ultimo[columna]))
+
+
+def totales_anuales(datos, delito="All"):
+    """{año: total} de un delito o de todos, con los años de los periodos"""
+    periodos = datos.periodos
+    columnas = [periodos.columna(año) for año in periodos.años]
+    if delito == "All":
+        totales = datos.annual_df[columnas].sum().tolist()
+    else:
+        totales = datos.annual_df.loc[datos.annual_df["Delito"] == delito, columnas].iloc[0].tolist()
+    return dict(zip(periodos.años, totales))
+
+
+def resumen_anual(datos, delito="All"):
+    totales = totales_anuales(datos, delito)
+    años = datos.periodos.años
+    variaciones = {año: variacion(totales[previo], totales[año]) for previo, año in zip(años, años[1:])}
+    return ResumenAnual(totales, variaciones)
+
+
+def resumen_mensual(datos, delito="All"):
+    periodos = datos.periodos
+    completos = periodos.meses_completos
+    matriz = datos.mensual(delito)
+    anterior = matriz.fila(periodos.anterior).tolist()
+    actual = matriz.fila(periodos.actual).tolist()
+
+    reportados = actual[:completos]
+    extremos_actual = extremos(reportados, MESES) if sum(reportados) > 0 else None
+
+    variaciones = {
+        MESES[i]: (actual[i] - anterior[i]) / anterior[i] * 100
+        for i in range(completos)
+        if anterior[i] > 0
+    }
+    mayor_aumento, mayor_disminucion = _aumento_y_disminucion(variaciones)
+
+    # Promedio mensual de cada trimestre: el año anterior completo, el actual solo con sus meses completos
+    promedios_anterior = matriz.fila(periodos.anterior).reshape(4, 3).mean(axis=1)
+    trimestres = []
+    for q, (nombre, promedio_anterior) in enumerate(zip(TRIMESTRES, promedios_anterior.tolist())):
+        meses = [i for i in range(3 * q, 3 * q + 3) if i < completos]
+        promedio_actual = sum(actual[i] for i in meses) / len(meses) if meses else None
+        porcentaje = None
+        if promedio_actual is not None and promedio_anterior > 0:
+            porcentaje = (promedio_actual - promedio_anterior) / promedio_anterior * 100
+        trimestres.append(Trimestre(nombre, promedio_anterior, promedio_actual, porcentaje))
+
+    # Proyección del resto del año actual: promedio de los meses ya reportados con casos
+    proyeccion = None
+    if extremos_actual is not None and completos < 12:
+        con_casos = [valor for valor in reportados if valor > 0]
+        proyeccion = Proyeccion(MESES[completos], float(np.mean(con_casos)) if con_casos else 0.0)
+
+    return ResumenMensual(
+        anterior=anterior,
+        actual=actual,
+        variacion=variacion(sum(anterior[:completos]), sum(reportados)),
+        extremos_anterior=extremos(anterior, MESES),
+        extremos_actual=extremos_actual,
+        variaciones=variaciones,
+        mayor_aumento=mayor_aumento,
+        mayor_disminucion=mayor_disminucion,
+        trimestres=trimestres,
+        proyeccion=proyeccion,
+    )
+
+
+def _promedio_semanas(serie, desde, hasta):
+    semanas = [semana for semana in serie if desde <= semana <= hasta]
+    if not semanas:
+        return None
+    return sum(serie[semana] for semana in semanas) / len(semanas)
+
+
+def resumen_semanal(datos, delito="All"):
+    periodos = datos.periodos
+    matriz = datos.semanal(delito)
+    anterior = matriz.serie(periodos.anterior)
+    actual = matriz.serie(periodos.actual)
+
+    comunes = sorted(set(anterior) & set(actual))
+    variaciones = {
+        semana: (actual[semana] - anterior[semana]) / anterior[semana] * 100
+        for semana in comunes
+        if anterior[semana] > 0
+    }
+    mayor_aumento, mayor_disminucion = _aumento_y_disminucion(variaciones)
+
+    trimestres = []
+    for nombre, (desde, hasta) in zip(TRIMESTRES, SEMANAS_TRIMESTRE):
+        promedio_anterior = _promedio_semanas(anterior, desde, hasta)
+        promedio_actual = _promedio_semanas(actual, desde, hasta)
+        if promedio_anterior is None and promedio_actual is None:
+            continue
+        porcentaje = None
+        if promedio_anterior is not None and promedio_actual is not None and promedio_anterior > 0:
+            porcentaje = (promedio_actual - promedio_anterior) / promedio_anterior * 100
+        trimestres.append(Trimestre(nombre, promedio_anterior, promedio_actual, porcentaje))
+
+    return ResumenSemanal(
+        anterior=anterior,
+        actual=actual,
+        variacion=variacion(sum(anterior.values()), sum(actual.values())),
+        extremos_anterior=extremos_serie(anterior),
+        extremos_actual=extremos_serie(actual),
+        semanas_comunes=len(comunes),
+        variaciones=variaciones,
+        mayor_aumento=mayor_aumento,
+        mayor_disminucion=mayor_disminucion,
+        trimestres=trimestres,
+    )
+
+
+def homicidios_semana12(datos):
+    """Homicidios y femicidios de la semana 12 del año actual"""
+    return int(datos.semanal(HOMICIDIOS).serie(datos.periodos.actual).get(12, 0))
+
+
+def resumen_general(datos):
+    """Visión general de la comuna: totales y tendencia por año, delitos extremos del año
+    anterior y meses extremos del total de delitos"""
+    periodos = datos.periodos
+    totales = totales_anuales(datos)
+    años = periodos.años
+    tendencias = {año: variacion(totales[previo], totales[año]) for previo, año in zip(años, años[1:])}
+    mas_frecuente, menos_frecuente = _mas_y_menos_frecuente(datos.annual_df, periodos.columna(periodos.anterior))
+
+    mensuales = totales_mensuales(datos.monthly_df)
+    anterior = mensuales.fila(periodos.anterior)
+    reportados = mensuales.fila(periodos.actual)[:periodos.meses_completos]
+
+    return ResumenGeneral(
+        totales=totales,
+        tendencias=tendencias,
+        mas_frecuente=mas_frecuente,
+        menos_frecuente=menos_frecuente,
+        extremos_mensuales_anterior=extremos(anterior, MESES),
+        extremos_mensuales_actual=extremos(reportados, MESES) if reportados.sum() > 0 else None,
+        homicidios_semana12=homicidios_semana12(datos),
+    )
+
+
+def metricas_clave(datos):
+    periodos = datos.periodos
+    anterior, actual = periodos.anterior, periodos.actual
+    annual_df = datos.annual_df
+
+    total_anterior = int(annual_df[periodos.columna(anterior)].sum())
+    total_actual = int(annual_df[periodos.columna(actual)].sum())
+
+    # El año actual se compara con el mismo periodo (semanas reportadas) del año anterior
+    if periodos.meses_completos == 12:
+        anterior_comparable = total_anterior
+    else:
+        anterior_comparable = datos.semanal().fila(anterior)[:periodos.ultima_semana + 1].sum()
+    previo = anterior - 1
+    total_previo = int(annual_df[periodos.columna(previo)].sum()) if previo in periodos.años else 0
+
+    # Robos con violencia del último mes completo del año actual
+    mes_corte = max(periodos.meses_completos - 1, 0)
+    robos = int(datos.mensual(ROBOS_VIOLENCIA).fila(actual)[mes_corte])
+
+    return MetricasClave(
+        total_anterior=total_anterior,
+        total_actual=total_actual,
+        mas_frecuente_anterior=_mas_y_menos_frecuente(annual_df, periodos.columna(anterior))[0],
+        mas_frecuente_actual=_mas_y_menos_frecuente(annual_df, periodos.columna(actual))[0],
+        variacion_mismo_periodo=variacion(anterior_comparable, total_actual),
+        variacion_anual=variacion(total_previo, total_anterior),
+        robos_violencia_mes_corte=Periodo(MESES[mes_corte], robos),
+        homicidios_semana12=homicidios_semana12(datos),
+    )
@@ -0,0 +1,180 @@
+"""Benchmark del pipeline de datos y del dashboard, fuera del servidor Streamlit.
+
+Uso: python benchmark.py [--comunas N] [--delitos 30] [--sesgo 1.0] [--desde 2023-01-01] [--hasta 2025-08-10] [--reruns 20]
+
+Genera un dataset nacional sintético (todas las comunas de data.comunas por defecto),
+lo ingiere a un directorio temporal y mide latencia (p50/p95/p99), throughput y memoria
+pico de cada etapa, incluidos los análisis de analisis.py por comuna. Las etapas del
+dashboard se miden corriendo app11.py con AppTest y leyendo los perfiles de instrumentation.
+"""
+import argparse
+import datetime
+import os
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import analisis
+import cube
+import data
+import ingest
+import instrumentation
+import queries
+from synthetic import dataset_sintetico
+
+
+def medir(nombre, funcion, repeticiones=1):
+    """Ejecuta la función, devolviendo su último resultado y las métricas de la etapa.
+
+    Los tiempos se toman sin tracemalloc (que distorsiona la latencia); la memoria pico
+    se mide en una ejecución adicional.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    resultado = funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, resumen(nombre, tiempos, pico)
+
+
+def resumen(nombre, tiempos, pico=None):
+    tiempos = np.asarray(tiempos, dtype=float)
+    p50, p95, p99 = np.percentile(tiempos, [50, 95, 99]) if len(tiempos) else (np.nan,) * 3
+    return {
+        "etapa": nombre,
+        "n": len(tiempos),
+        "p50_ms": p50 * 1000,
+        "p95_ms": p95 * 1000,
+        "p99_ms": p99 * 1000,
+        "ops_s": len(tiempos) / tiempos.sum() if tiempos.sum() > 0 else np.nan,
+        "pico_mb": pico / 2**20 if pico is not None else np.nan,
+    }
+
+
+def bench_pipeline(df, directorio):
+    resultados = []
+    ruta_columnar = os.path.join(directorio, "ESTADISTICA_DELITO.parquet")
+    ruta_cubo = os.path.join(directorio, "ESTADISTICA_DELITO.cubo.npz")
+
+    tabla, r = medir("ingest: DataFrame -> tabla tipada", lambda: ingest.tabla_desde_dataframe(df))
+    resultados.append(r)
+    _, r = medir("ingest: escribir Parquet", lambda: ingest.escribir_columnar(tabla, ruta_columnar))
+    resultados.append(r)
+    df_columnar, r = medir("leer Parquet (COLUMNAS_CUBO)", lambda: ingest.leer_columnar(ruta_columnar, cube.COLUMNAS_CUBO, delito_categorico=True))
+    resultados.append(r)
+    df_compacto, r = medir("compactar (categorías y enteros angostos)", lambda: cube.compactar(df_columnar))
+    resultados.append(r)
+    cubo, r = medir("construir_cubo", lambda: cube.construir_cubo(df_compacto))
+    resultados.append(r)
+    _, r = medir("guardar_cubo", lambda: cube.guardar_cubo(cubo, ruta_cubo))
+    resultados.append(r)
+    _, r = medir("cargar_cubo", lambda: cube.cargar_cubo(ruta_cubo))
+    resultados.append(r)
+
+    # Desde aquí el proceso usa los archivos sintéticos como fuente
+    data.RUTA_XLSX = os.path.join(directorio, "ESTADISTICA_DELITO.xlsx")
+    data.RUTA_COLUMNAR = ruta_columnar
+    data.RUTA_CUBO = ruta_cubo
+
+    def get_cubo_en_frio():
+        # Sin cubo en disco ni en memoria: get_cubo lee el Parquet, compacta, construye y guarda
+        os.remove(ruta_cubo)
+        data._cubo = None
+        return data.get_cubo()
+
+    _, r = medir("get_cubo en frío (Parquet -> cubo)", get_cubo_en_frio)
+    resultados.append(r)
+
+    codcoms = data.get_cubo().codcoms.tolist()
+    for nombre, funcion in [
+        ("get_data (CuboDelitos.tablas)", lambda c: data.get_data(c)),
+        ("queries.matriz_mensual (miss)", lambda c: queries.matriz_mensual(c)),
+        ("queries.matriz_mensual (hit)", lambda c: queries.matriz_mensual(c)),
+        ("queries.matriz_semanal (miss)", lambda c: queries.matriz_semanal(c)),
+        ("analisis.resumen_general", lambda c: analisis.resumen_general(analisis.DatosComuna.cargar(c))),
+        ("analisis.metricas_clave", lambda c: analisis.metricas_clave(analisis.DatosComuna.cargar(c))),
+    ]:
+        tiempos = []
+        for codcom in codcoms:
+            t0 = time.perf_counter()
+            funcion(codcom)
+            tiempos.append(time.perf_counter() - t0)
+        resultados.append(resumen(nombre, tiempos))
+    return resultados
+
+
+def bench_dashboard(codcoms, reruns, script="app11.py"):
+    """Corre el dashboard con AppTest y agrega los tiempos por etapa de instrumentation.
+
+    Las pestañas perezosas se desactivan: AppTest no cambia de pestaña, y con ellas solo se
+    dibujaría (y mediría) la Anual.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from dashboard import pagina
+
+    ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), script)
+    instrumentation.limpiar_perfiles()
+    tiempos_rerun = []
+    perezosas, pagina.PESTAÑAS_PEREZOSAS = pagina.PESTAÑAS_PEREZOSAS, False
+    try:
+        for codcom in codcoms[:reruns]:
+            app = AppTest.from_file(ruta, default_timeout=300)
+            app.query_params["codcom"] = str(codcom)
+            t0 = time.perf_counter()
+            app.run()
+            tiempos_rerun.append(time.perf_counter() - t0)
+            if app.exception:
+                raise RuntimeError(f"{script} falló con codcom={codcom}: {app.exception}")
+            # Segundo rerun de la misma sesión cambiando el delito de cada pestaña
+            for selector in app.selectbox:
+                selector.select_index(min(1, len(selector.options) - 1))
+            app.run()
+    finally:
+        pagina.PESTAÑAS_PEREZOSAS = perezosas
+
+    por_etapa = {}
+    for perfil in instrumentation.perfiles():
+        for etapa in perfil.etapas:
+            clave = f"{script}: {etapa['etapa']}" + (f" ({etapa['cache']})" if etapa["cache"] else "")
+            por_etapa.setdefault(clave, []).append(etapa["segundos"])
+    resultados = [resumen(f"{script}: primer rerun completo", tiempos_rerun)]
+    resultados += [resumen(clave, tiempos) for clave, tiempos in sorted(por_etapa.items())]
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comunas", type=int, default=len(data.comunas), help="cantidad de comunas (de data.comunas)")
+    parser.add_argument("--delitos", type=int, default=30, help="delitos distintos (los del archivo real y luego sintéticos)")
+    parser.add_argument("--sesgo", type=float, default=1.0, help="exponente de Zipf entre comunas (0 = uniforme)")
+    parser.add_argument("--desde", type=datetime.date.fromisoformat, default=datetime.date(2023, 1, 1))
+    parser.add_argument("--hasta", type=datetime.date.fromisoformat, default=datetime.date(2025, 8, 10))
+    parser.add_argument("--reruns", type=int, default=20, help="comunas a renderizar con AppTest (0 para omitir)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    codcoms = list(data.comunas)[:args.comunas]
+    df, r_generar = medir("generar dataset sintético", lambda: dataset_sintetico(codcoms, args.delitos, args.desde, args.hasta, args.sesgo))
+    print(f"Dataset sintético: {len(df):,} filas, {len(codcoms)} comunas, {args.delitos} delitos, {args.desde} a {args.hasta}")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        resultados = [r_generar] + bench_pipeline(df, directorio)
+        if args.reruns:
+            resultados += bench_dashboard(codcoms, args.reruns)
+
+    tabla = pd.DataFrame(resultados).set_index("etapa")
+    with pd.option_context("display.width", 200, "display.max_rows", None, "display.max_columns", None, "display.float_format", "{:,.2f}".format):
+        print(tabla)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Cachés acotados del proceso, compartidos por todas las sesiones.
+
+LRU descarta la entrada usada hace más tiempo cuando se supera la cantidad de entradas
+o el presupuesto de bytes, y lleva contadores de hits, misses y desalojos.
+memoizar() lo usa para cachear funciones por sus argumentos (que deben ser hashables).
+"""
+import functools
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Presupuesto de memoria del caché de datos y gráficos por comuna
+MAX_BYTES = int(float(os.environ.get("DELITO_CACHE_MB", 256)) * 2**20)
+MAX_ENTRADAS = 20000
+
+_FALTA = object()
+
+
+def tamaño(valor):
+    """Estimación de los bytes que retiene un valor cacheado"""
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(index=True, deep=True).sum())
+    if isinstance(valor, pd.Series):
+        return int(valor.memory_usage(index=True, deep=True))
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(tamaño(v) for v in valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamaño(k) + tamaño(v) for k, v in valor.items())
+    if hasattr(valor, "to_plotly_json"):
+        # Figura de Plotly: lo que pesa es su especificación
+        return len(valor.to_json())
+    if hasattr(valor, "__dict__"):
+        return sys.getsizeof(valor) + tamaño(vars(valor))
+    return sys.getsizeof(valor)
+
+
+class LRU:
+    """Diccionario acotado que descarta la entrada usada hace más tiempo.
+
+    maxsize limita la cantidad de entradas y max_bytes la suma de sus tamaños estimados;
+    una entrada que por sí sola supera max_bytes no se guarda.
+    """
+
+    def __init__(self, maxsize=None, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._datos = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.desalojos = 0
+
+    def get(self, clave, defecto=None):
+        with self._lock:
+            if clave not in self._datos:
+                self.misses += 1
+                return defecto
+            self.hits += 1
+            self._datos.move_to_end(clave)
+            return self._datos[clave][0]
+
+    def put(self, clave, valor):
+        peso = tamaño(valor) if self.max_bytes is not None else 0
+        with self._lock:
+            self._quitar(clave)
+            if self.max_bytes is not None and peso > self.max_bytes:
+                self.desalojos += 1
+                return
+            self._datos[clave] = (valor, peso)
+            self._bytes += peso
+            while self._excedido():
+                _, (_, peso_viejo) = self._datos.popitem(last=False)
+                self._bytes -= peso_viejo
+                self.desalojos += 1
+
+    def _excedido(self):
+        return (
+            (self.maxsize is not None and len(self._datos) > self.maxsize)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        )
+
+    def _quitar(self, clave):
+        entrada = self._datos.pop(clave, None)
+        if entrada is not None:
+            self._bytes -= entrada[1]
+        return entrada
+
+    def pop(self, clave):
+        with self._lock:
+            entrada = self._quitar(clave)
+        return entrada[0] if entrada is not None else None
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._datos)
+
+    def __contains__(self, clave):
+        # Sin mover la entrada ni contar un hit o un miss
+        return clave in self._datos
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    def estadisticas(self):
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "entradas": len(self._datos),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "desalojos": self.desalojos,
+                "tasa_hits": self.hits / consultas if consultas else None,
+            }
+
+
+# Caché del proceso para datos, tablas, matrices, gráficos y textos por comuna, acotado en
+# bytes (DELITO_CACHE_MB). Los valores se comparten entre sesiones: quien los recibe no los modifica
+CACHE = LRU(maxsize=MAX_ENTRADAS, max_bytes=MAX_BYTES)
+
+
+def memoizar(cache, clave_extra=None):
+    """Decorador: cachea la función en `cache` con clave (nombre de la función, argumentos).
+
+    clave_extra es una función sin argumentos cuyo valor se suma a la clave: para resultados
+    que dependen de un estado global (p. ej. los periodos reportados) además de los argumentos.
+    La función decorada expone cacheado(*args) y guardar(valor, *args), para llenar el caché
+    con un valor calculado por otro camino (p. ej. el precalentamiento).
+    """
+    def decorador(funcion):
+        def clave_de(args):
+            return (funcion.__qualname__, args) if clave_extra is None else (funcion.__qualname__, args, clave_extra())
+
+        @functools.wraps(funcion)
+        def envoltura(*args):
+            clave = clave_de(args)
+            resultado = cache.get(clave, _FALTA)
+            if resultado is _FALTA:
+                resultado = funcion(*args)
+                cache.put(clave, resultado)
+            return resultado
+
+        envoltura.cache = cache
+        envoltura.cacheado = lambda *args: clave_de(args) in cache
+        envoltura.guardar = lambda valor, *args: cache.put(clave_de(args), valor)
+        return envoltura
+
+    return decorador
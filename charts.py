@@ -0,0 +1,218 @@
+"""Constructores cacheados del dashboard: datos por comuna, tablas y gráficos.
+
+Viven en un módulo importable (y no dentro de cada app*.py) para que las páginas y el
+precalentamiento de warmup.py llamen a las mismas funciones y compartan las mismas
+entradas de caché. Cada resultado depende solo de (codcom, version) y del delito; el gráfico
+mensual, además, de los meses completos del año actual.
+"""
+import logging
+import time
+
+import numpy as np
+import plotly.io as pio
+import streamlit as st
+
+try:
+    # API interna de Streamlit para enviar una especificación ya serializada (probada con 1.65);
+    # si cambia o falla, mostrar_grafico vuelve a st.plotly_chart
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+except ImportError:
+    PlotlyChartProto = None
+
+import cache
+import figures
+import formato
+import instrumentation
+import queries
+from cube import MESES
+from data import get_data, get_periodos, version_comuna
+
+
+logger = logging.getLogger(__name__)
+
+# Función para formatear números con separadores de miles en formato chileno
+format_number_chile = formato.numero
+
+
+def mostrar_grafico(figura):
+    """Envía la figura al navegador a todo el ancho, sin reconstruir el go.Figure"""
+    global PlotlyChartProto
+    if PlotlyChartProto is not None:
+        try:
+            _enviar_spec(figura)
+            return
+        except Exception:
+            # La API interna cambió en esta versión de Streamlit: desde aquí se usa la pública
+            logger.warning("Falló el envío directo del gráfico; se usa st.plotly_chart", exc_info=True)
+            PlotlyChartProto = None
+    st.plotly_chart(pio.from_json(figura.spec.decode()), width="stretch")
+
+
+def _enviar_spec(figura):
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(dg)
+    proto.spec = figura.spec.decode()
+    proto.config = "{}"
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=None,
+        key_as_main_identity=False,
+        dg=dg,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=("points", "box", "lasso"),
+        is_selection_activated=False,
+        theme="streamlit",
+        width="stretch",
+        height="content",
+        alt=None,
+    )
+    dg._enqueue("plotly_chart", proto, layout_config=LayoutConfig(width="stretch", height=figura.alto))
+
+def clave_version(CODCOM):
+    """Versión de los datos de la comuna y de las etiquetas de los periodos: forma parte de las claves
+    de caché, así una ingesta incremental solo invalida las comunas que recibieron semanas nuevas.
+
+    La última semana reportada no entra: lo que depende de ella (textos, proyección mensual)
+    la suma a su propia clave con memoizar(clave_extra=...)"""
+    return (version_comuna(CODCOM), get_periodos().etiquetas)
+
+
+def clave_periodos():
+    """Periodos completos (años y última semana reportada), para los textos de análisis"""
+    return get_periodos().clave
+
+
+def clave_meses_completos():
+    """Meses completos del año actual: fijan dónde empieza la proyección del gráfico mensual"""
+    return get_periodos().meses_completos
+
+
+# Caché del proceso por comuna (cache.CACHE), el mismo de las matrices de queries
+CACHE = cache.CACHE
+
+
+# Función para cargar datos con caché. El spinner solo aparece en un cache miss,
+# que es también el único caso en que se mide y registra el tiempo real de carga
+@cache.memoizar(CACHE)
+def get_data_session(CODCOM, version):
+    inicio = time.perf_counter()
+    with st.spinner('Cargando datos...'):
+        datos = get_data(CODCOM)
+    instrumentation.registrar_carga(CODCOM, time.perf_counter() - inicio)
+    instrumentation.marcar_miss()
+    return datos
+
+
+# Tabla anual con las frecuencias ya formateadas como texto: se muestra sin Styler
+@cache.memoizar(CACHE)
+def tabla_anual(codcom, version, selected_crime):
+    instrumentation.marcar_miss()
+    annual_df = get_data_session(codcom, version)[0]
+    if selected_crime != "All":
+        annual_df = annual_df[annual_df["Delito"] == selected_crime]
+    periodos = get_periodos()
+    tabla = annual_df.copy()
+    for year in periodos.años:
+        columna = periodos.columna(year)
+        tabla[columna] = formato.miles(annual_df[columna].to_numpy())
+    return tabla
+
+
+def config_tabla_anual():
+    """Columnas de frecuencia alineadas a la derecha, como números"""
+    periodos = get_periodos()
+    return {
+        periodos.columna(year): st.column_config.TextColumn(periodos.columna(year), alignment="right")
+        for year in periodos.años
+    }
+
+
+# Función para renderizar gráfico anual
+@cache.memoizar(CACHE)
+def render_annual_chart(codcom, version, selected_crime):
+    instrumentation.marcar_miss()
+    annual_df = get_data_session(codcom, version)[0]
+    periodos = get_periodos()
+    
+    # Una barra por año con datos, sin importar cuántos sean
+    columns = [periodos.columna(year) for year in periodos.años]
+    if selected_crime == "All":
+        values = annual_df[columns].to_numpy().sum(axis=0)
+    else:
+        values = annual_df.loc[annual_df["Delito"] == selected_crime, columns].to_numpy()[0]
+    
+    categories = [periodos.etiqueta(year) for year in periodos.años]
+    
+    # Colores con nueva paleta mejorada (los más recientes en los tonos más claros)
+    palette = ['rgba(30, 64, 175, 0.8)', 'rgba(59, 130, 246, 0.8)', 'rgba(96, 165, 250, 0.8)']
+    colors = [palette[max(0, len(palette) - len(categories) + i)] for i in range(len(categories))]
+    
+    return figures.anual().figura(
+        f"Frecuencia Anual de {'Todos los Delitos' if selected_crime == 'All' else selected_crime}",
+        [dict(x=categories, y=values, marker=dict(color=colors))]
+    )
+
+# Función para renderizar gráfico mensual
+@cache.memoizar(CACHE, clave_extra=clave_meses_completos)
+def render_monthly_chart(codcom, version, selected_crime):
+    instrumentation.marcar_miss()
+    periodos = get_periodos()
+    
+    months = MESES
+    
+    # Filas de la matriz (año × periodo) de la comuna
+    monthly_matrix = queries.matriz_mensual(codcom, selected_crime)
+    dataPrevious = monthly_matrix.fila(periodos.anterior)
+    dataCurrent = monthly_matrix.fila(periodos.actual)
+    
+    # Último mes con datos reales del año actual: el último mes completo, o uno posterior con datos
+    currentMonthIndex = max(periodos.meses_completos - 1, 0)
+    posteriores = np.flatnonzero(dataCurrent[periodos.meses_completos:] > 0)
+    if len(posteriores):
+        currentMonthIndex = periodos.meses_completos + posteriores[-1]
+    
+    # Calcular promedio para proyección
+    actualCurrentValues = dataCurrent[:currentMonthIndex+1]
+    averageCurrent = actualCurrentValues[actualCurrentValues > 0].mean() if actualCurrentValues.any() else 0
+    
+    # Crear datos de proyección
+    projectionCurrent = dataCurrent.copy()
+    projectionCurrent[currentMonthIndex+1:] = round(averageCurrent)
+    
+    crime = selected_crime if selected_crime != "All" else "Total"
+    return figures.mensual().figura(
+        f"Frecuencia Mensual de {'Todos los Delitos' if selected_crime == 'All' else selected_crime} ({periodos.anterior} vs. {periodos.actual} Proyectado)",
+        [
+            # Datos del año anterior
+            dict(x=months, y=dataPrevious, name=f'Frecuencia {periodos.anterior} ({crime})'),
+            # Año actual: parte real (línea sólida) y proyectada (línea discontinua)
+            dict(x=months[:currentMonthIndex+1], y=dataCurrent[:currentMonthIndex+1], name=f'Frecuencia {periodos.actual} (Datos reales)'),
+            dict(x=months[currentMonthIndex:], y=projectionCurrent[currentMonthIndex:], name=f'Frecuencia {periodos.actual} (Proyección)'),
+        ]
+    )
+
+# Función para renderizar gráfico semanal
+@cache.memoizar(CACHE)
+def render_weekly_chart(codcom, version, selected_crime):
+    instrumentation.marcar_miss()
+    periodos = get_periodos()
+    
+    # Filas de la matriz (año × periodo) de la comuna, ordenadas por semana
+    weekly_matrix = queries.matriz_semanal(codcom, selected_crime)
+    dataPrevious = weekly_matrix.serie(periodos.anterior)
+    dataCurrent = weekly_matrix.serie(periodos.actual)
+    
+    crime = selected_crime if selected_crime != "All" else "Total"
+    return figures.semanal().figura(
+        f"Frecuencia Semanal de {'Todos los Delitos' if selected_crime == 'All' else selected_crime} ({periodos.anterior} vs. {periodos.actual})",
+        [
+            dict(x=list(dataPrevious), y=list(dataPrevious.values()), name=f'Frecuencia Semanal {periodos.anterior} ({crime})'),
+            dict(x=list(dataCurrent), y=list(dataCurrent.values()), name=f'Frecuencia Semanal {periodos.etiqueta(periodos.actual)} ({crime})'),
+        ]
+    )
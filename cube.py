@@ -0,0 +1,343 @@
+import datetime
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+MESES = ["Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"]
+
+# Semanas 1..53 (la posición 0 queda sin uso para indexar directo por número de semana)
+N_SEMANAS = 54
+
+# Columnas del archivo columnar que necesita construir_cubo
+COLUMNAS_CUBO = ["delito", "frecuencia", "codcom", "fecha", "semana"]
+
+# Representación compacta en memoria de esas columnas: delito como categoría (códigos int8),
+# enteros angostos y año/mes enteros en lugar de la fecha
+TIPOS_COMPACTOS = {
+    "delito": "category",
+    "frecuencia": "int32",
+    "codcom": "int16",
+    "año": "int16",
+    "mes": "int8",
+    "semana": "int8",
+}
+
+
+def fin_semana(año, semana):
+    """Último día de la semana N de un año: semanas lunes-domingo recortadas al año, la 1 empieza el 1 de enero"""
+    inicio_año = datetime.date(año, 1, 1)
+    lunes = inicio_año - datetime.timedelta(days=inicio_año.weekday()) + datetime.timedelta(weeks=semana - 1)
+    return min(lunes + datetime.timedelta(days=6), datetime.date(año, 12, 31))
+
+
+class Periodos:
+    """Años con datos y último periodo reportado, descubiertos a partir de los datos"""
+
+    def __init__(self, años, ultima_semana):
+        self.años = [int(año) for año in años]
+        self.actual = self.años[-1]
+        # Sin un segundo año con datos, el anterior es el año calendario previo: tablas() le da
+        # columna y filas en cero, así las comparaciones contra el anterior no necesitan otro caso
+        self.anterior = self.años[-2] if len(self.años) > 1 else self.actual - 1
+        # Años que comparan las vistas mensual y semanal
+        self.comparados = self.años[-2:]
+        self.ultima_semana = int(ultima_semana)
+        self.ultimo_dia = fin_semana(self.actual, self.ultima_semana)
+        self.parcial = self.ultimo_dia < datetime.date(self.actual, 12, 31)
+        # Meses del año actual cubiertos completos: el mes del último día reportado solo cuenta si terminó
+        self.meses_completos = (self.ultimo_dia + datetime.timedelta(days=1)).month - 1 if self.parcial else 12
+        self.clave = (tuple(self.años), self.ultima_semana)
+        # Lo que fija los nombres de las columnas y los años comparados: solo cambia con un año nuevo
+        # o al cerrarse el año actual, no con cada semana ingerida
+        self.etiquetas = (tuple(self.años), self.parcial)
+
+    def etiqueta(self, año):
+        return f"{año} (a la fecha)" if año == self.actual and self.parcial else str(año)
+
+    def columna(self, año):
+        """Nombre de la columna del año en la tabla anual"""
+        return f"Frecuencia {self.etiqueta(año)}"
+
+    @property
+    def mes_corte(self):
+        """Último mes completo del año actual (None si aún no termina ninguno)"""
+        return MESES[self.meses_completos - 1] if self.meses_completos else None
+
+
+class CuboDelitos:
+    """Agregados densos por (codcom, delito, año, periodo) para todas las comunas"""
+
+    def __init__(self, codcoms, delitos, años, anual, mensual, semanal, filas, semanas_presentes, versiones=None):
+        self.codcoms = codcoms
+        self.delitos = delitos
+        self.años = años
+        self.anual = anual                            # [codcom, delito, año]
+        self.mensual = mensual                        # [codcom, delito, año, mes]
+        self.semanal = semanal                        # [codcom, delito, año, semana]
+        self.filas = filas                            # filas de origen por [codcom, delito, año]
+        self.semanas_presentes = semanas_presentes    # [codcom, año, semana]
+        # Versión de los datos de cada comuna: cambia solo cuando una ingesta toca esa comuna
+        self.versiones = versiones if versiones is not None else np.full(len(codcoms), time.time_ns(), dtype=np.int64)
+        self._posicion = {codcom: i for i, codcom in enumerate(codcoms.tolist())}
+        self._delito = {delito: j for j, delito in enumerate(delitos.tolist())}
+        self._periodos = None
+
+    def indice(self, CODCOM):
+        return self._posicion.get(CODCOM)
+
+    def version(self, CODCOM):
+        """Versión de los datos de la comuna, para usarla en las claves de caché (0 si no tiene datos)"""
+        i = self.indice(CODCOM)
+        return int(self.versiones[i]) if i is not None else 0
+
+    def periodos(self):
+        """Años y última semana reportada a nivel nacional"""
+        if self._periodos is None:
+            presentes = self.semanas_presentes.any(axis=0)       # [año, semana]
+            con_datos = presentes.any(axis=1)
+            ultimo = np.flatnonzero(con_datos)[-1]
+            self._periodos = Periodos(self.años[con_datos], np.flatnonzero(presentes[ultimo])[-1])
+        return self._periodos
+
+    def tablas(self, CODCOM):
+        """Tablas anual, mensual y semanal de una comuna (mismo formato que los pivots de get_data).
+
+        Salen compactas: delito como categoría y frecuencias en int32, que es lo que guarda el caché.
+        """
+        i = self.indice(CODCOM)
+        if i is None:
+            raise ValueError(f"No hay datos para la comuna {CODCOM}")
+        filas = self.filas[i]
+        periodos = self.periodos()
+
+        # Anual: una fila por delito con datos y una columna por cada año con datos en el país
+        # (densa: la comuna sin datos un año queda en cero, en vez de correr las etiquetas)
+        con_delito = filas.sum(axis=1) > 0
+        con_año = np.isin(self.años, periodos.años)
+        anual = self.anual[i][np.ix_(con_delito, con_año)]
+        años_anual = self.años[con_año].tolist()
+        sin_anterior = periodos.anterior not in periodos.años
+        if sin_anterior:
+            # Un solo año con datos: el anterior entra como columna en cero, antes del actual
+            anual = np.hstack([np.zeros((len(anual), 1), dtype=anual.dtype), anual])
+            años_anual = [periodos.anterior] + años_anual
+        pivot = pd.DataFrame({"Delito": self._categorias(self.delitos[con_delito]), "codcom": np.int16(CODCOM)})
+        pivot[[periodos.columna(año) for año in años_anual]] = anual.astype(np.int32)
+
+        # Mensual y semanal: una fila por (delito, año) con datos, solo los años comparados
+        d_idx, y_idx = np.nonzero(filas * np.isin(self.años, periodos.comparados))
+        años_filas = self.años[y_idx]
+        mensual = self.mensual[i][d_idx, y_idx]
+
+        # Cada columna semanal pertenece a un año: vale cero en las filas de los otros años.
+        # np.nonzero recorre (año, semana) en orden numérico, así que las columnas ya salen ordenadas
+        k_sem, w_sem = np.nonzero(self.semanas_presentes[i] & np.isin(self.años, periodos.comparados)[:, None])
+        etiquetas = [f"{self.años[k]} - SEMANA {w:02d}" for k, w in zip(k_sem, w_sem)]
+        semanal = self.semanal[i][d_idx, y_idx][:, w_sem] * (y_idx[:, None] == k_sem[None, :])
+
+        if sin_anterior:
+            # Filas en cero del año anterior para cada delito, cada una antes de la del actual
+            d_cero = np.flatnonzero(con_delito)
+            d_idx = np.concatenate([d_cero, d_idx])
+            años_filas = np.concatenate([np.full(len(d_cero), periodos.anterior), años_filas])
+            mensual = np.vstack([np.zeros((len(d_cero), 12), dtype=mensual.dtype), mensual])
+            semanal = np.vstack([np.zeros((len(d_cero), len(etiquetas)), dtype=semanal.dtype), semanal])
+            orden = np.lexsort((años_filas, d_idx))
+            d_idx, años_filas, mensual, semanal = d_idx[orden], años_filas[orden], mensual[orden], semanal[orden]
+
+        pivot2 = pd.DataFrame({"Delito": self._categorias(self.delitos[d_idx]), "Año": años_filas.astype(np.int16)})
+        pivot2[MESES] = mensual.astype(np.int32)
+        pivot3 = pd.concat([
+            pd.DataFrame({"delito": self._categorias(self.delitos[d_idx]), "año": años_filas.astype(np.int16)}),
+            pd.DataFrame(semanal.astype(np.int32), columns=etiquetas),
+        ], axis=1)
+        pivot3.columns.name = "semana"
+        return pivot, pivot2, pivot3
+
+    def _categorias(self, valores):
+        # Delitos como categoría sobre el eje completo del cubo: códigos int8 en vez de un texto por fila
+        return pd.Categorical(valores, categories=self.delitos)
+
+    def _filtro_delito(self, i, delito):
+        # Selector sobre el eje de delitos y filas de origen por año para ese selector
+        if delito == "All":
+            return slice(None), self.filas[i].sum(axis=0)
+        d = self._delito.get(delito)
+        if d is None:
+            return None, np.zeros(len(self.años), dtype=np.int64)
+        return d, self.filas[i, d]
+
+    def matriz(self, CODCOM, delito="All", granularidad="mensual"):
+        """Matriz (año × periodo) de una comuna para un delito o para todos, con su máscara de periodos reportados"""
+        i = self.indice(CODCOM)
+        n_periodos = 12 if granularidad == "mensual" else N_SEMANAS
+        if i is None:
+            return MatrizPeriodos(self.años, np.zeros((len(self.años), n_periodos), dtype=np.int64), np.zeros((len(self.años), n_periodos), dtype=bool))
+        d, filas = self._filtro_delito(i, delito)
+        con_datos = filas > 0
+        if granularidad == "mensual":
+            valores = self.mensual[i, d] if d is not None else np.zeros((len(self.años), 12), dtype=np.int64)
+            presentes = np.repeat(con_datos[:, None], 12, axis=1)
+        else:
+            valores = self.semanal[i, d] if d is not None else np.zeros((len(self.años), N_SEMANAS), dtype=np.int64)
+            presentes = self.semanas_presentes[i] & con_datos[:, None]
+        if valores.ndim == 3:
+            valores = valores.sum(axis=0)
+        return MatrizPeriodos(self.años, valores, presentes)
+
+
+class MatrizPeriodos:
+    """Frecuencias por (año, periodo); las filas de años sin datos quedan en cero"""
+
+    def __init__(self, años, valores, presentes):
+        self.años = años
+        self.valores = valores
+        self.presentes = presentes
+        # Las matrices se comparten entre sesiones a través del caché: solo lectura
+        self.valores.flags.writeable = False
+        self.presentes.flags.writeable = False
+
+    def _fila(self, año):
+        k = np.searchsorted(self.años, año)
+        if k < len(self.años) and self.años[k] == año:
+            return k
+        return None
+
+    def fila(self, año):
+        """Valores de un año como arreglo (ceros si el año no tiene datos)"""
+        k = self._fila(año)
+        if k is None:
+            return np.zeros(self.valores.shape[1], dtype=self.valores.dtype)
+        return self.valores[k]
+
+    def serie(self, año, etiquetas=None):
+        """Periodos reportados de un año como {periodo: valor}; por defecto el periodo es su índice"""
+        k = self._fila(año)
+        if k is None:
+            return {}
+        periodos = np.flatnonzero(self.presentes[k])
+        claves = periodos.tolist() if etiquetas is None else [etiquetas[p] for p in periodos]
+        return dict(zip(claves, self.valores[k, periodos].tolist()))
+
+
+def totales_mensuales(monthly_df):
+    """Matriz (año × mes) con la suma de todos los delitos de una tabla mensual ('Año' y una
+    columna por mes): una sola reducción sobre las columnas de meses, sin recorrer filas"""
+    años_filas = monthly_df['Año'].to_numpy()
+    años, fila = np.unique(años_filas, return_inverse=True)
+    valores = monthly_df.reindex(columns=MESES, fill_value=0).to_numpy()
+    totales = np.zeros((len(años), len(MESES)), dtype=valores.dtype)
+    np.add.at(totales, fila, valores)
+    return MatrizPeriodos(años, totales, np.ones(totales.shape, dtype=bool))
+
+
+def compactar(df):
+    """Convierte las columnas COLUMNAS_CUBO a la representación compacta (TIPOS_COMPACTOS)"""
+    fecha = pd.to_datetime(df["fecha"])
+    df = df.drop(columns="fecha").assign(año=fecha.dt.year, mes=fecha.dt.month)
+    return df.astype({columna: tipo for columna, tipo in TIPOS_COMPACTOS.items() if columna in df.columns})
+
+
+def construir_cubo(df):
+    """Calcula en una sola pasada vectorizada las tres granularidades para todas las comunas.
+
+    Acepta la tabla compacta (año y mes enteros, delito como categoría) o las columnas COLUMNAS_CUBO tal cual.
+    """
+    if "año" in df.columns and "mes" in df.columns:
+        año = df["año"].to_numpy()
+        mes = df["mes"].to_numpy() - 1
+    else:
+        fecha = pd.to_datetime(df["fecha"])
+        año = fecha.dt.year.to_numpy()
+        mes = fecha.dt.month.to_numpy() - 1
+    semana = df["semana"].to_numpy()
+    frecuencia = df["frecuencia"].to_numpy()
+
+    # Ejes en int64, como en los cubos ya guardados, aunque la tabla traiga enteros angostos
+    codcoms = np.unique(df["codcom"].to_numpy()).astype(np.int64)
+    años = np.unique(año).astype(np.int64)
+    delito = df["delito"]
+    if isinstance(delito.dtype, pd.CategoricalDtype):
+        # Con el delito como categoría solo se ordenan las categorías, no un texto por fila
+        delito = delito.cat.remove_unused_categories()
+        delitos, rango = np.unique(delito.cat.categories.to_numpy().astype(str), return_inverse=True)
+        d = rango[delito.cat.codes.to_numpy()]
+    else:
+        delitos = np.unique(delito.to_numpy().astype(str))
+        d = np.searchsorted(delitos, delito.to_numpy().astype(str))
+    c = np.searchsorted(codcoms, df["codcom"].to_numpy())
+    y = np.searchsorted(años, año)
+    C, D, Y = len(codcoms), len(delitos), len(años)
+
+    def acumular(indice, forma, pesos=frecuencia):
+        total = np.bincount(indice, weights=pesos, minlength=int(np.prod(forma)))
+        return total.astype(np.int64).reshape(forma)
+
+    cdy = (c * D + d) * Y + y
+    anual = acumular(cdy, (C, D, Y))
+    mensual = acumular(cdy * 12 + mes, (C, D, Y, 12))
+    semanal = acumular(cdy * N_SEMANAS + semana, (C, D, Y, N_SEMANAS))
+    filas = acumular(cdy, (C, D, Y), pesos=None)
+    semanas_presentes = acumular((c * Y + y) * N_SEMANAS + semana, (C, Y, N_SEMANAS), pesos=None) > 0
+    return CuboDelitos(codcoms, delitos, años, anual, mensual, semanal, filas, semanas_presentes)
+
+
+def fusionar_cubos(base, nuevo):
+    """Suma al cubo base los agregados de filas nuevas (p. ej. semanas recién publicadas).
+
+    Los ejes se unen; solo las comunas presentes en el cubo nuevo reciben una versión nueva.
+    """
+    codcoms = np.union1d(base.codcoms, nuevo.codcoms)
+    delitos = np.union1d(base.delitos, nuevo.delitos)
+    años = np.union1d(base.años, nuevo.años)
+    forma = (len(codcoms), len(delitos), len(años))
+
+    def expandir(cubo, nombre, periodos=()):
+        arreglo = getattr(cubo, nombre)
+        resultado = np.zeros(forma + periodos, dtype=arreglo.dtype)
+        ejes = np.ix_(np.searchsorted(codcoms, cubo.codcoms), np.searchsorted(delitos, cubo.delitos), np.searchsorted(años, cubo.años))
+        resultado[ejes] = arreglo
+        return resultado
+
+    def presentes(cubo):
+        resultado = np.zeros((len(codcoms), len(años), N_SEMANAS), dtype=bool)
+        resultado[np.ix_(np.searchsorted(codcoms, cubo.codcoms), np.searchsorted(años, cubo.años))] = cubo.semanas_presentes
+        return resultado
+
+    versiones = np.zeros(len(codcoms), dtype=np.int64)
+    versiones[np.searchsorted(codcoms, base.codcoms)] = base.versiones
+    versiones[np.searchsorted(codcoms, nuevo.codcoms)] = time.time_ns()
+    return CuboDelitos(
+        codcoms, delitos, años,
+        anual=expandir(base, "anual") + expandir(nuevo, "anual"),
+        mensual=expandir(base, "mensual", (12,)) + expandir(nuevo, "mensual", (12,)),
+        semanal=expandir(base, "semanal", (N_SEMANAS,)) + expandir(nuevo, "semanal", (N_SEMANAS,)),
+        filas=expandir(base, "filas") + expandir(nuevo, "filas"),
+        semanas_presentes=presentes(base) | presentes(nuevo),
+        versiones=versiones,
+    )
+
+
+def guardar_cubo(cubo, ruta_cubo):
+    """Guarda el cubo como arreglos NumPy (escritura atómica)"""
+    temporal = f"{ruta_cubo}.tmp.npz"
+    np.savez(
+        temporal,
+        codcoms=cubo.codcoms,
+        delitos=cubo.delitos,
+        años=cubo.años,
+        anual=cubo.anual,
+        mensual=cubo.mensual,
+        semanal=cubo.semanal,
+        filas=cubo.filas,
+        semanas_presentes=cubo.semanas_presentes,
+        versiones=cubo.versiones,
+    )
+    os.replace(temporal, ruta_cubo)
+
+
+def cargar_cubo(ruta_cubo):
+    with np.load(ruta_cubo, allow_pickle=False) as arreglos:
+        return CuboDelitos(**{nombre: arreglos[nombre] for nombre in arreglos.files})
@@ -0,0 +1,22 @@
+"""Dashboard de delitos por comuna.
+
+Un solo motor para todas las páginas: cada script (app.py, app11.py, Home.py, ...) es una
+Configuracion con su comuna por defecto, su diseño y su tema, y llama a ejecutar(). Los datos,
+gráficos y textos salen del mismo caché del proceso, así las páginas servidas por un mismo
+servidor cargan cada comuna una sola vez.
+
+    import dashboard
+
+    dashboard.ejecutar(dashboard.Configuracion(codcom_defecto=1101, layout="con_resumen"), __file__)
+"""
+import warmup
+from dashboard import estilos
+from dashboard.config import Configuracion
+from dashboard.layouts import LAYOUTS, registrar_layout
+from dashboard.pagina import Pagina, ejecutar
+from dashboard.secciones import SECCIONES, seccion
+
+# Precalentamiento de cachés en segundo plano (DELITO_PRECALENTAR): arranca una sola vez por
+# proceso, al importar el paquete, y no dentro del rerun de una página
+warmup.iniciar_desde_entorno()
+
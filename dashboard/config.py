@@ -0,0 +1,15 @@
+"""Configuración de una página del dashboard: lo único que cambia entre las variantes."""
+from dashboard import estilos
+
+
+class Configuracion:
+    """Comuna por defecto, diseño (nombre en LAYOUTS) y tema de una página.
+
+    La comuna se lee de ?codcom= en la URL; codcom_defecto se usa cuando no viene o no es válida
+    """
+
+    def __init__(self, codcom_defecto=13101, layout="completo", estilo=estilos.actual, icono="📈"):
+        self.codcom_defecto = codcom_defecto
+        self.layout = layout
+        self.estilo = estilo
+        self.icono = icono
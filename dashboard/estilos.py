@@ -0,0 +1,671 @@
+"""Hojas de estilo del dashboard.
+
+Cada tema es una función sin argumentos que inyecta su CSS en la página; la configuración de
+cada página elige uno (por defecto `actual`).
+"""
+import streamlit as st
+
+from stylo import set_custom_styles
+
+CSS_ACTUAL = """
+<style>
+    /* ===== VARIABLES Y CONFIGURACIÓN GENERAL ===== */
+    :root {
+        /* Nueva paleta de azules (manteniendo tus colores pero organizados) */
+        --color-primary: #101967;
+        --color-secondary: #2a2e7f;
+        --color-tertiary: #454297;
+        --color-accent: #5f57af;
+        --color-light-accent: #796bc7;
+        --color-extra-light: #e6e6fa;
+        
+        /* Colores funcionales */
+        --danger-color: #ef4444;
+        --success-color: #10b981;
+        --warning-color: #f59e0b;
+        
+        /* Colores neutros */
+        --color-white: #ffffff;
+        --color-light: #f8fafc;
+        --color-gray: #64748b;
+        --color-gray-light: #e2e8f0;
+        --color-gray-dark: #334155;
+        
+        /* Variables de diseño */
+        --border-radius: 16px;
+        --transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+        --shadow: 0 10px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
+        --shadow-lg: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
+        --shadow-card: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+    }
+
+    /* ===== RESET Y ESTILOS BASE ===== */
+    * {
+        box-sizing: border-box;
+    }
+    /* ===== COMPONENTES DE STREAMLIT ===== */
+    /* Tabs */
+    .stTabs [data-baseweb="tab-list"] {
+        display: flex;
+        justify-content: space-between;
+        gap: 0;
+        margin-bottom: 2rem;
+        background: linear-gradient(135deg, rgba(69, 66, 151, 0.1), rgba(95, 87, 175, 0.1));
+        border-radius: var(--border-radius);
+        padding: 6px;
+        box-shadow: var(--shadow);
+        position: relative;
+        overflow: hidden;
+    }
+
+    .stTabs [data-baseweb="tab-list"]:before {
+        content: "";
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: linear-gradient(45deg, rgba(69, 66, 151, 0.05), rgba(121, 107, 199, 0.05));
+        z-index: -1;
+    }
+
+    .stTabs [data-baseweb="tab"] {
+        flex: 1;
+        height: 70px;
+        font-size: 18px;
+        font-weight: 700;
+        background-color: transparent;
+        border-radius: 12px;
+        margin: 0;
+        transition: var(--transition);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: var(--color-gray);
+        position: relative;
+        overflow: hidden;
+        letter-spacing: -0.025em;
+    }
+
+    .stTabs [data-baseweb="tab"]:before {
+        content: "";
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 0;
+        height: 100%;
+        background: linear-gradient(135deg, var(--color-tertiary), var(--color-accent));
+        transition: width 0.4s ease;
+        z-index: -1;
+        border-radius: 12px;
+    }
+
+    .stTabs [data-baseweb="tab"]:hover {
+        color: var(--color-tertiary);
+        transform: translateY(-2px);
+    }
+
+    .stTabs [data-baseweb="tab"]:hover:before {
+        width: 100%;
+    }
+
+    
+    /* ===== GARANTIZAR FONDO BLANCO EN TODOS LOS ELEMENTOS ===== */
+    body, .stApp, .main, .block-container, 
+    .metric-card, .analysis-card, .explanation-card,
+    .hero-header, .footer, .dataframe-container,
+    .plotly-container, .weekly-insight {
+        background-color: var(--color-white) !important;
+    }
+
+
+/* Fuerza el fondo blanco en caso de que otros estilos lo estén cambiando */
+    div[data-testid="stAppViewContainer"] {
+        background-color: var(--color-white) !important;
+    }
+
+
+section[data-testid="stSidebar"] {
+        background-color: var(--color-white) !important;
+    }
+
+div[data-testid="stVerticalBlock"] {
+        background-color: var(--color-white) !important;
+    }
+
+/* Contenedor de gráficos */
+    .plotly-container {
+        border-radius: var(--border-radius);
+        overflow: hidden;
+        box-shadow: var(--shadow);
+        margin-bottom: 35px;
+        border: 1px solid var(--color-gray-light);
+        background: var(--color-white);
+    }
+
+
+    .stApp {
+        background-color: var(--color-white) !important;
+    }
+
+.main .block-container {
+        background-color: var(--color-white) !important;
+        padding: 0;
+    }
+
+/* ===== LAYOUT PRINCIPAL ===== */
+    .css-1d391kg { /* Sidebar */
+        background-color: var(--color-white) !important;
+        padding-top: 2rem;
+        border-right: 1px solid var(--color-gray-light);
+        box-shadow: 4px 0 6px -1px rgba(0, 0, 0, 0.1);
+    }
+
+
+body {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+        background-color: var(--color-white) !important;
+        color: var(--color-primary);
+        line-height: 1.7;
+        font-size: 16px;
+        margin: 0;
+        padding: 0;
+    }
+
+.stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, var(--color-tertiary), var(--color-accent));
+        color: var(--color-white);
+        box-shadow: 0 10px 15px -3px rgba(69, 66, 151, 0.3);
+        transform: translateY(-2px);
+    }
+            
+    /* Select boxes */
+    .stSelectbox > div > div > div {
+        /*
+        background-color: var(--color-white);
+        */
+        border-radius: 12px;
+        border: 2px solid var(--color-gray-light);
+        padding: 14px;
+        font-size: 1rem;
+        box-shadow: var(--shadow-card);
+    }
+
+    .stSelectbox > div > div > div:hover {
+        border-color: var(--color-tertiary);
+    }
+
+    /* Sliders */
+    .stSlider > div > div > div > div {
+        background: linear-gradient(to right, var(--color-tertiary), var(--color-light-accent));
+    }
+
+    /* Multi-select */
+    .stMultiSelect > div > div > div {
+        background-color: var(--color-white);
+        border-radius: 12px;
+        border: 2px solid var(--color-gray-light);
+        box-shadow: var(--shadow-card);
+    }
+
+    /* Date input */
+    .stDateInput > div > div > div {
+        background-color: var(--color-white);
+        border-radius: 12px;
+        border: 2px solid var(--color-gray-light);
+        padding: 12px;
+        box-shadow: var(--shadow-card);
+    }
+
+    /* Buttons */
+    .stButton > button {
+        background: linear-gradient(135deg, var(--color-tertiary), var(--color-accent));
+        color: var(--color-white);
+        border: none;
+        border-radius: 12px;
+        padding: 16px 28px;
+        font-weight: 700;
+        transition: var(--transition);
+        box-shadow: 0 10px 15px -3px rgba(69, 66, 151, 0.3);
+        font-size: 1rem;
+        letter-spacing: 0.025em;
+    }
+
+    .stButton > button:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 20px 25px -5px rgba(69, 66, 151, 0.4);
+        background: linear-gradient(135deg, var(--color-accent), var(--color-light-accent));
+    }
+
+    /* Download buttons */
+    .stDownloadButton > button {
+        background: linear-gradient(135deg, var(--success-color), var(--color-light-accent));
+        color: var(--color-white);
+        border: none;
+        border-radius: 12px;
+        padding: 14px 24px;
+        font-weight: 600;
+        transition: var(--transition);
+        box-shadow: 0 10px 15px -3px rgba(16, 185, 129, 0.3);
+        font-size: 1rem;
+    }
+
+    .stDownloadButton > button:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 20px 25px -5px rgba(16, 185, 129, 0.4);
+    }
+
+    /* Spinner */
+    .stSpinner > div > div {
+        border-top-color: var(--color-tertiary) !important;
+    }
+
+    /* ===== COMPONENTES PERSONALIZADOS ===== */
+    /* Grid de métricas */
+    .metrics-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+        gap: 25px;
+        margin-bottom: 40px;
+    }
+
+    /* Tarjetas de métricas */
+    .metric-card {
+        background: var(--color-white);
+        border-radius: var(--border-radius);
+        padding: 30px;
+        box-shadow: var(--shadow);
+        transition: var(--transition);
+        position: relative;
+        overflow: hidden;
+        border: 1px solid var(--color-gray-light);
+    }
+
+    .metric-card:hover {
+        transform: translateY(-8px);
+        box-shadow: var(--shadow-lg);
+        border-color: var(--color-tertiary);
+    }
+
+    .metric-card .icon {
+        font-size: 3rem;
+        margin-bottom: 20px;
+        display: inline-block;
+        background: linear-gradient(135deg, var(--color-tertiary), var(--color-light-accent));
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        filter: drop-shadow(0 4px 6px rgba(69, 66, 151, 0.2));
+    }
+
+    .metric-card .title {
+        font-size: 1.25rem;
+        font-weight: 700;
+        color: var(--color-primary);
+        margin-bottom: 20px;
+        position: relative;
+        line-height: 1.4;
+    }
+
+    .metric-card .title:after {
+        content: "";
+        position: absolute;
+        bottom: -10px;
+        left: 0;
+        width: 50px;
+        height: 4px;
+        background: linear-gradient(to right, var(--color-tertiary), var(--color-light-accent));
+        border-radius: 4px;
+    }
+
+    .metric-card .value {
+        font-size: 2rem;
+        font-weight: 800;
+        color: var(--color-primary);
+        margin-top: 15px;
+        line-height: 1.3;
+    }
+
+    .metric-card .value.green {
+        color: var(--success-color);
+    }
+
+    .metric-card .value.red {
+        color: var(--danger-color);
+    }
+
+    .metric-card .value p {
+        margin: 8px 0;
+        display: flex;
+        align-items: center;
+    }
+
+    .metric-card .value strong {
+        margin-right: 10px;
+    }
+
+    /* Tarjetas de análisis */
+    .analysis-card {
+        background: var(--color-white);
+        border-radius: var(--border-radius);
+        padding: 35px;
+        box-shadow: var(--shadow);
+        margin-bottom: 35px;
+        border: 1px solid var(--color-gray-light);
+        position: relative;
+        overflow: hidden;
+    }
+
+    .analysis-card:before {
+        content: "";
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 6px;
+        background: linear-gradient(to right, var(--color-tertiary), var(--color-accent));
+    }
+
+    .analysis-card h3 {
+        color: var(--color-primary);
+        margin-bottom: 25px;
+        font-weight: 700;
+        position: relative;
+        padding-bottom: 15px;
+        font-size: 1.5rem;
+    }
+
+    .analysis-card h3:after {
+        content: "";
+        position: absolute;
+        bottom: 0;
+        left: 0;
+        width: 70px;
+        height: 4px;
+        background: linear-gradient(to right, var(--color-tertiary), var(--color-light-accent));
+        border-radius: 4px;
+    }
+
+    /* Tarjetas de explicación */
+    .explanation-card {
+        background: var(--color-white);
+        border-radius: var(--border-radius);
+        padding: 35px;
+        box-shadow: var(--shadow);
+        margin-bottom: 35px;
+        border: 1px solid var(--color-gray-light);
+        position: relative;
+        overflow: hidden;
+    }
+
+    .explanation-card:before {
+        content: "";
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 6px;
+        background: linear-gradient(to right, var(--color-accent), var(--color-light-accent));
+    }
+
+    .explanation-card h3 {
+        color: var(--color-primary);
+        margin-bottom: 25px;
+        font-weight: 700;
+        position: relative;
+        padding-bottom: 15px;
+        font-size: 1.5rem;
+    }
+
+    .explanation-card h3:after {
+        content: "";
+        position: absolute;
+        bottom: 0;
+        left: 0;
+        width: 70px;
+        height: 4px;
+        background: linear-gradient(to right, var(--color-accent), var(--color-light-accent));
+        border-radius: 4px;
+    }
+
+    /* Insights semanales */
+    .weekly-insight {
+        background: linear-gradient(135deg, rgba(69, 66, 151, 0.05), rgba(121, 107, 199, 0.05));
+        border-radius: var(--border-radius);
+        padding: 25px;
+        margin-bottom: 25px;
+        border-left: 5px solid var(--color-tertiary);
+        transition: var(--transition);
+        position: relative;
+    }
+
+    .weekly-insight:hover {
+        transform: translateX(8px);
+        box-shadow: var(--shadow);
+        background: linear-gradient(135deg, rgba(69, 66, 151, 0.08), rgba(121, 107, 199, 0.08));
+    }
+
+    .weekly-insight h4 {
+        color: var(--color-tertiary);
+        margin-top: 0;
+        margin-bottom: 20px;
+        font-weight: 700;
+        display: flex;
+        align-items: center;
+        font-size: 1.2rem;
+    }
+
+    .weekly-insight h4:before {
+        content: "📊";
+        margin-right: 12px;
+        font-size: 1.5rem;
+    }
+
+    .weekly-insight ul {
+        margin-bottom: 0;
+        padding-left: 25px;
+    }
+
+    .weekly-insight li {
+        margin-bottom: 12px;
+        position: relative;
+        padding-left: 5px;
+        font-size: 1.05rem;
+        line-height: 1.6;
+        color: var(--color-primary);
+    }
+
+    .weekly-insight li:before {
+        content: "•";
+        color: var(--color-tertiary);
+        font-weight: bold;
+        position: absolute;
+        left: -18px;
+        font-size: 1.2rem;
+    }
+
+    /* Header principal */
+    .hero-header {
+        text-align: center;
+        padding: 3.5rem 0;
+        margin-bottom: 3.5rem;
+        position: relative;
+        border-radius: var(--border-radius);
+        overflow: hidden;
+        background: var(--color-white);
+        box-shadow: var(--shadow);
+    }
+
+    .hero-header:before {
+        content: "";
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(135deg, rgba(69, 66, 151, 0.1), rgba(121, 107, 199, 0.1));
+        z-index: -1;
+        border-radius: var(--border-radius);
+    }
+
+    .hero-header h1 {
+        font-size: 3.5rem;
+        font-weight: 800;
+        color: var(--color-primary);
+        margin-bottom: 1.5rem;
+        position: relative;
+        display: inline-block;
+        line-height: 1.2;
+        letter-spacing: -0.025em;
+    }
+
+    .hero-header h1:after {
+        content: "";
+        position: absolute;
+        bottom: -15px;
+        left: 10%;
+        width: 80%;
+        height: 5px;
+        background: linear-gradient(to right, var(--color-tertiary), var(--color-light-accent));
+        border-radius: 5px;
+    }
+
+    .hero-header p {
+        font-size: 1.4rem;
+        color: var(--color-gray);
+        max-width: 900px;
+        margin: 2rem auto 0;
+        line-height: 1.6;
+        font-weight: 500;
+    }
+
+    .source-info {
+        font-size: 1rem;
+        color: var(--color-gray);
+        font-style: italic;
+        margin-top: 2rem;
+        font-weight: 400;
+    }
+
+    /* Contenedor de dataframes */
+    .dataframe-container {
+        margin: 25px 0;
+        border-radius: var(--border-radius);
+        overflow: hidden;
+        box-shadow: var(--shadow);
+        border: 1px solid var(--color-gray-light);
+        background: var(--color-white);
+    }
+
+    /* Análisis dinámico */
+    .dynamic-analysis {
+        line-height: 1.9;
+        color: var(--color-primary);
+        font-size: 1.1rem;
+    }
+
+    .dynamic-analysis strong {
+        color: var(--color-tertiary);
+        font-weight: 700;
+    }
+
+    /* Footer */
+    .footer {
+        text-align: center;
+        padding: 40px 0;
+        margin-top: 4rem;
+        color: var(--color-gray);
+        font-size: 1rem;
+        border-top: 1px solid var(--color-gray-light);
+        background: var(--color-white);
+        border-radius: var(--border-radius);
+        margin-bottom: 2rem;
+    }
+
+    
+
+    /* ===== EFECTOS Y ANIMACIONES ===== */
+    .hover-effect {
+        transition: var(--transition);
+    }
+
+    .hover-effect:hover {
+        transform: translateY(-5px);
+        box-shadow: var(--shadow-lg);
+    }
+
+    /* Animaciones */
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(30px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    @keyframes slideIn {
+        from { opacity: 0; transform: translateX(-30px); }
+        to { opacity: 1; transform: translateX(0); }
+    }
+
+    @keyframes countUp {
+        from { opacity: 0; transform: scale(0.8); }
+        to { opacity: 1; transform: scale(1); }
+    }
+
+    .metric-card, .analysis-card, .explanation-card {
+        animation: fadeIn 0.8s ease-out;
+    }
+
+    .weekly-insight {
+        animation: slideIn 0.8s ease-out;
+    }
+
+    .metric-card .value {
+        animation: countUp 1s ease-out;
+    }
+
+    /* ===== MEJORAS TIPOGRÁFICAS ===== */
+    h2, h3, h4 {
+        letter-spacing: -0.025em;
+        color: var(--color-primary);
+        font-weight: 700;
+    }
+
+    /* ===== MEJORAS DE ESPACIADO ===== */
+    .element-container {
+        margin-bottom: 2rem;
+    }
+
+    .stTabs [data-testid="stVerticalBlock"] > div {
+        padding-top: 25px;
+    }
+
+    /* ===== MÉTRICAS CLAVE ===== */
+    .key-metrics {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+        gap: 20px;
+        margin-bottom: 30px;
+    }
+
+    /* ===== MEJORAS EN LA BARRA LATERAL ===== */
+    .css-1d391kg .css-1l02zno {
+        font-weight: 600;
+        color: var(--color-primary);
+    }
+            
+    .stSelectbox p{
+        color:black;
+        font-size: 22px; /* más grande */
+        font-weight: bold; /* negrita */
+        color: black;
+        margin-bottom: 8px;            
+    }
+</style>
+"""
+
+
+def actual():
+    """Paleta de azules con pestañas destacadas"""
+    st.markdown(CSS_ACTUAL, unsafe_allow_html=True)
+
+
+# Tema morado de las primeras versiones (stylo.py)
+clasico = set_custom_styles
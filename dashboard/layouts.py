@@ -0,0 +1,27 @@
+"""Diseños de página: la lista ordenada de secciones (por nombre en SECCIONES) que dibuja cada uno."""
+from dashboard.secciones import SECCIONES
+
+LAYOUTS = {
+    # Encabezado, pestañas anual/mensual/semanal, métricas clave y explicaciones
+    "completo": ("encabezado", "pestañas", "metricas", "explicaciones", "pie"),
+    # Igual, con la visión general anual antes de las pestañas
+    "con_resumen": ("encabezado", "resumen", "pestañas", "metricas", "explicaciones", "pie"),
+    # Solo los gráficos y su análisis
+    "graficos": ("encabezado", "pestañas", "explicaciones", "pie"),
+    # Portada de la aplicación multipágina: filtro global en la barra lateral e índice de páginas
+    "inicio": ("encabezado", "resumen", "pestañas", "metricas", "explicaciones", "pie", "filtro_lateral", "bienvenida"),
+}
+
+
+def registrar_layout(nombre, secciones):
+    """Agrega (o reemplaza) un diseño; falla si nombra una sección que no está registrada"""
+    faltantes = [seccion for seccion in secciones if seccion not in SECCIONES]
+    if faltantes:
+        raise KeyError(f"Secciones no registradas: {', '.join(faltantes)}")
+    LAYOUTS[nombre] = tuple(secciones)
+
+
+def secciones_de(layout):
+    """Funciones de un diseño, dado por su nombre en LAYOUTS o directamente como lista de secciones"""
+    nombres = LAYOUTS[layout] if isinstance(layout, str) else layout
+    return [SECCIONES[nombre] for nombre in nombres]
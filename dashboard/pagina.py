@@ -0,0 +1,96 @@
+"""Motor del dashboard: arma el contexto de un rerun y corre las secciones del diseño elegido.
+
+Los datos salen de los constructores cacheados de charts (un caché por proceso, acotado en
+bytes), así todas las páginas que corren en el mismo servidor comparten la carga de cada comuna.
+"""
+import os
+from urllib.parse import unquote
+
+import pandas as pd
+import streamlit as st
+
+import charts
+import instrumentation
+from charts import clave_version, get_data_session
+from dashboard.layouts import secciones_de
+from data import get_comuna, get_periodos
+
+# En modo perezoso (por defecto) solo corre la pestaña visible
+PESTAÑAS_PEREZOSAS = os.environ.get('DELITO_PESTANAS_PEREZOSAS', '1') == '1'
+
+
+def codcom_desde_url(defecto):
+    """Comuna de ?codcom= en la URL; `defecto` si no viene o no es un número"""
+    if 'codcom' not in st.query_params:
+        return defecto
+    try:
+        return int(unquote(st.query_params['codcom']))
+    except (ValueError, TypeError):
+        return defecto
+
+
+class Pagina:
+    """Lo que las secciones leen en un rerun: comuna, periodos, versión de los datos, tablas y perfil"""
+
+    def __init__(self, config, codcom, perfil):
+        self.config = config
+        self.codcom = codcom
+        self.comuna = get_comuna(codcom)
+        self.perfil = perfil
+        self.pestañas_perezosas = PESTAÑAS_PEREZOSAS
+
+        # Años y último periodo reportado, descubiertos desde los datos
+        self.periodos = get_periodos()
+        # Versión de los datos de la comuna y de las etiquetas de los periodos (parte de las claves de caché)
+        self.version = clave_version(codcom)
+
+        with perfil.etapa("get_data_session", cacheada=True) as etapa:
+            self.annual_df, self.monthly_df, self.weekly_df = get_data_session(codcom, self.version)
+            etapa["filas"] = len(self.annual_df) + len(self.monthly_df) + len(self.weekly_df)
+
+        self.crime_types = sorted(self.annual_df['Delito'].unique())
+        # Delito preseleccionado en las pestañas (?delito=)
+        self.default_crime = st.query_params.get('delito', 'All')
+
+
+def ejecutar(config, script="dashboard"):
+    """Dibuja una página completa con la configuración dada; `script` identifica la página en el perfil"""
+    CODCOM = codcom_desde_url(config.codcom_defecto)
+
+    st.set_page_config(
+        page_title=f"Análisis de Delincuencia en {get_comuna(CODCOM)}",
+        page_icon=config.icono,
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Perfil de tiempos del rerun: se ve con ?debug=1 y se exporta como JSON lines
+    debug = st.query_params.get('debug') == '1' or os.environ.get('DELITO_DEBUG') == '1'
+    perfil = instrumentation.PerfilRerun(os.path.basename(script), CODCOM)
+
+    with perfil.etapa("css"):
+        config.estilo()
+
+    pagina = Pagina(config, CODCOM, perfil)
+    for seccion in secciones_de(config.layout):
+        seccion(pagina)
+
+    perfil.finalizar()
+    if debug:
+        panel_depuracion(pagina)
+    return pagina
+
+
+def panel_depuracion(pagina):
+    """Perfil del rerun, percentiles de carga y estado del caché por comuna"""
+    perfil = pagina.perfil
+    with st.expander("⏱️ Perfil del rerun"):
+        st.dataframe(pd.DataFrame(perfil.etapas), width="stretch")
+        carga = instrumentation.percentiles_carga(pagina.codcom)
+        if carga['n']:
+            st.caption(f"Total del rerun: {perfil.total:.3f} s · Carga de datos (n={carga['n']}): p50={carga['p50']:.3f} s, p95={carga['p95']:.3f} s")
+        else:
+            st.caption(f"Total del rerun: {perfil.total:.3f} s")
+        estadisticas = charts.CACHE.estadisticas()
+        st.caption(f"Caché por comuna: {estadisticas['entradas']} entradas, {estadisticas['bytes'] / 2**20:.1f} de {estadisticas['max_bytes'] / 2**20:.0f} MB · hits={estadisticas['hits']}, misses={estadisticas['misses']}, desalojos={estadisticas['desalojos']}")
+        st.download_button("Exportar perfiles (JSON lines)", instrumentation.perfiles_jsonl(), file_name="perfiles.jsonl")
@@ -0,0 +1,468 @@
+"""Secciones de las páginas del dashboard.
+
+Cada sección es una función que recibe la Pagina del rerun y dibuja su parte; se registran
+por nombre con @seccion y un diseño (LAYOUTS) es la lista ordenada de secciones que corre una
+página. Un diseño nuevo solo combina secciones existentes o registra las suyas.
+"""
+import functools
+
+import streamlit as st
+
+import instrumentation
+from charts import (
+    clave_version,
+    config_tabla_anual,
+    format_number_chile,
+    mostrar_grafico,
+    render_annual_chart,
+    render_monthly_chart,
+    render_weekly_chart,
+    tabla_anual,
+)
+from dashboard import textos
+
+SECCIONES = {}
+
+
+def seccion(nombre):
+    """Decorador: registra una función sección(pagina) con su nombre"""
+    def registrar(funcion):
+        SECCIONES[nombre] = funcion
+        return funcion
+
+    return registrar
+
+
+def fragmento(contenido):
+    """Decorador: st.fragment cuyo contenido recibe (pagina, perfil, version).
+
+    En la corrida completa el fragmento usa el perfil y la versión de la página. En un rerun solo
+    del fragmento Streamlit vuelve a pasar la Pagina de la última corrida completa, con su perfil
+    ya finalizado: el fragmento abre y finaliza un perfil propio y vuelve a leer la versión de la
+    comuna, que una ingesta pudo haber cambiado.
+    """
+    @st.fragment
+    @functools.wraps(contenido)
+    def envoltura(pagina):
+        if pagina.perfil.total is None:
+            contenido(pagina, pagina.perfil, pagina.version)
+            return
+        perfil = instrumentation.PerfilRerun(f"{pagina.perfil.script} fragmento", pagina.codcom)
+        try:
+            contenido(pagina, perfil, clave_version(pagina.codcom))
+        finally:
+            perfil.finalizar()
+
+    return envoltura
+
+
+@seccion("encabezado")
+def encabezado(pagina):
+    COMUNA_NAME = pagina.comuna
+    st.markdown(f"""
+    <div class="hero-header">
+        <h1><span class="text-blue-300">📈</span> Panorama Delictual en {COMUNA_NAME}</h1>
+        <p class="text-xl">Análisis interactivo de frecuencias de delitos por temporalidad.</p>
+        <p class="source-info mt-4">Datos extraídos de la Plataforma de Información Ley STOP de Carabineros de Chile, sistematizados por el Instituto Libertad.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+@seccion("resumen")
+def resumen(pagina):
+    """Visión general anual de la comuna (totales, tendencia y extremos)"""
+    PERIODOS = pagina.periodos
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader(f"Visión General de la Situación Delictual Anual en {pagina.comuna} ({PERIODOS.años[0]}-{PERIODOS.actual})")
+    with pagina.perfil.etapa("generate_general_analysis", cacheada=True):
+        general_html = textos.generate_general_analysis(pagina.codcom, pagina.version)
+    st.markdown('<div class="general-analysis">' + general_html + '</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# Contenido de la pestaña Anual: es un fragmento, así cambiar el delito solo vuelve a correr esta pestaña
+@fragmento
+def pestaña_anual(pagina, perfil, VERSION):
+    CODCOM = pagina.codcom
+    crime_types, default_crime = pagina.crime_types, pagina.default_crime
+    
+    default_index = 0
+    if default_crime != 'All' and default_crime in crime_types:
+        default_index = crime_types.index(default_crime) + 1
+    
+    selected_crime_annual = st.selectbox(
+        "Seleccionar Delito:",
+        ["All"] + crime_types,
+        key="annual_crime_select",
+        index=default_index
+    )
+    
+    with perfil.etapa("render_annual_chart", cacheada=True):
+        fig_annual = render_annual_chart(CODCOM, VERSION, selected_crime_annual)
+    mostrar_grafico(fig_annual)
+    
+    # Tabla de datos anuales con diseño mejorado
+    st.subheader("Datos Anuales Detallados")
+    st.markdown('<div class="dataframe-container">', unsafe_allow_html=True)
+    with perfil.etapa("tabla_anual", cacheada=True) as etapa:
+        tabla = tabla_anual(CODCOM, VERSION, selected_crime_annual)
+        etapa["filas"] = len(tabla)
+        st.dataframe(tabla, width="stretch", column_config=config_tabla_anual())
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Análisis dinámico
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Análisis de Tendencias Específicas")
+    with perfil.etapa("generate_analysis_text", cacheada=True):
+        analysis_text = textos.generate_analysis_text(CODCOM, VERSION, "Annual", selected_crime_annual)
+    st.markdown(f'<div class="dynamic-analysis">{analysis_text}</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# Contenido de la pestaña Mensual: es un fragmento, así cambiar el delito solo vuelve a correr esta pestaña
+@fragmento
+def pestaña_mensual(pagina, perfil, VERSION):
+    CODCOM = pagina.codcom
+    crime_types, default_crime = pagina.crime_types, pagina.default_crime
+    PERIODOS = pagina.periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    
+    default_index = 0
+    if default_crime != 'All' and default_crime in crime_types:
+        default_index = crime_types.index(default_crime) + 1
+    
+    selected_crime_monthly = st.selectbox(
+        "Seleccionar Delito:",
+        ["All"] + crime_types,
+        key="monthly_crime_select",
+        index=default_index
+    )
+    
+    with perfil.etapa("render_monthly_chart", cacheada=True):
+        fig_monthly = render_monthly_chart(CODCOM, VERSION, selected_crime_monthly)
+    mostrar_grafico(fig_monthly)
+    
+    # Análisis mensual detallado
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Análisis Mensual Detallado")
+    
+    with perfil.etapa("resumen_mensual", cacheada=True):
+        resultado = textos.resumen(CODCOM, VERSION, "Monthly", selected_crime_monthly)
+    
+    # Análisis 1: Meses con más y menos delitos
+    maxPrevious, minPrevious = resultado.extremos_anterior
+    st.markdown(f"""
+    <div class="weekly-insight">
+        <h4>📅 Análisis de Meses Críticos ({AÑO_ANTERIOR})</h4>
+        <ul>
+            <li><strong>Mes con mayor delincuencia:</strong> {maxPrevious.periodo} con {format_number_chile(maxPrevious.valor)} casos</li>
+            <li><strong>Mes con menor delincuencia:</strong> {minPrevious.periodo} con {format_number_chile(minPrevious.valor)} casos</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Para el año actual (solo los meses completos)
+    if resultado.extremos_actual is not None:
+        maxCurrent, minCurrent = resultado.extremos_actual
+        st.markdown(f"""
+        <div class="weekly-insight">
+            <h4>📅 Análisis de Meses Críticos ({AÑO_ACTUAL})</h4>
+            <ul>
+                <li><strong>Mes con mayor delincuencia:</strong> {maxCurrent.periodo} con {format_number_chile(maxCurrent.valor)} casos</li>
+                <li><strong>Mes con menor delincuencia:</strong> {minCurrent.periodo} con {format_number_chile(minCurrent.valor)} casos</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown(f"<p>No hay datos disponibles para {AÑO_ACTUAL}.</p>", unsafe_allow_html=True)
+    
+    # Análisis 2: Variación porcentual entre meses comparables
+    if resultado.variaciones:
+        st.markdown(f"""
+        <div class="weekly-insight">
+            <h4>📈 Variación Porcentual entre Meses Comparables</h4>
+            <ul>
+                <li><strong>Mayor aumento:</strong> {resultado.mayor_aumento.periodo} con un incremento del {resultado.mayor_aumento.valor:.1f}%</li>
+                <li><strong>Mayor disminución:</strong> {resultado.mayor_disminucion.periodo} con una reducción del {abs(resultado.mayor_disminucion.valor):.1f}%</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("<p>No se pudo calcular la variación porcentual para los meses comparables.</p>", unsafe_allow_html=True)
+    
+    # Análisis 3: Comparación por trimestre
+    st.markdown("<p><strong>Comparación por trimestre (promedio mensual):</strong></p>", unsafe_allow_html=True)
+    
+    for trimestre in resultado.trimestres:
+        if trimestre.actual is not None:
+            change_text = f"({trimestre.porcentaje:+.1f}%)" if trimestre.porcentaje is not None else "(N/A)"
+            st.markdown(f"<p><strong>{trimestre.nombre}:</strong> {AÑO_ANTERIOR}: {trimestre.anterior:.1f} casos/mes, {AÑO_ACTUAL}: {trimestre.actual:.1f} casos/mes {change_text}</p>", unsafe_allow_html=True)
+        else:
+            st.markdown(f"<p><strong>{trimestre.nombre}:</strong> {AÑO_ANTERIOR}: {trimestre.anterior:.1f} casos/mes, {AÑO_ACTUAL}: Sin datos</p>", unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Análisis dinámico existente
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Análisis de Tendencias Específicas")
+    with perfil.etapa("generate_analysis_text", cacheada=True):
+        analysis_text = textos.generate_analysis_text(CODCOM, VERSION, "Monthly", selected_crime_monthly)
+    st.markdown(f'<div class="dynamic-analysis">{analysis_text}</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# Contenido de la pestaña Semanal: es un fragmento, así cambiar el delito solo vuelve a correr esta pestaña
+@fragmento
+def pestaña_semanal(pagina, perfil, VERSION):
+    CODCOM = pagina.codcom
+    crime_types, default_crime = pagina.crime_types, pagina.default_crime
+    PERIODOS = pagina.periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    
+    default_index = 0
+    if default_crime != 'All' and default_crime in crime_types:
+        default_index = crime_types.index(default_crime) + 1
+    
+    selected_crime_weekly = st.selectbox(
+        "Seleccionar Delito:",
+        ["All"] + crime_types,
+        key="weekly_crime_select",
+        index=default_index
+    )
+    
+    with perfil.etapa("render_weekly_chart", cacheada=True):
+        fig_weekly = render_weekly_chart(CODCOM, VERSION, selected_crime_weekly)
+    mostrar_grafico(fig_weekly)
+    
+    # Análisis semanal detallado
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Análisis Semanal Detallado")
+    
+    with perfil.etapa("resumen_semanal", cacheada=True):
+        resultado = textos.resumen(CODCOM, VERSION, "Weekly", selected_crime_weekly)
+    
+    # Análisis 1: Mejor y peor semana
+    for año, extremos in ((AÑO_ANTERIOR, resultado.extremos_anterior), (AÑO_ACTUAL, resultado.extremos_actual)):
+        if extremos is not None:
+            st.markdown(f"""
+            <div class="weekly-insight">
+                <h4>📅 Análisis de Semanas Críticas ({año})</h4>
+                <ul>
+                    <li><strong>Peor semana:</strong> Semana {extremos.mayor.periodo} con {format_number_chile(extremos.mayor.valor)} casos (mayor incidencia delictiva)</li>
+                    <li><strong>Mejor semana:</strong> Semana {extremos.menor.periodo} con {format_number_chile(extremos.menor.valor)} casos (menor incidencia delictiva)</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"<p>No hay datos disponibles para {año}.</p>", unsafe_allow_html=True)
+    
+    # Análisis 2: Variación porcentual entre semanas comparables
+    if resultado.semanas_comunes:
+        if resultado.variaciones:
+            st.markdown(f"""
+            <div class="weekly-insight">
+                <h4>📈 Variación Porcentual entre Semanas Comparables</h4>
+                <ul>
+                    <li><strong>Mayor aumento:</strong> Semana {resultado.mayor_aumento.periodo} con un incremento del {resultado.mayor_aumento.valor:.1f}%</li>
+                    <li><strong>Mayor disminución:</strong> Semana {resultado.mayor_disminucion.periodo} con una reducción del {abs(resultado.mayor_disminucion.valor):.1f}%</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown("<p>No se pudo calcular la variación porcentual para las semanas comparables.</p>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<p>No hay semanas comparables entre {AÑO_ANTERIOR} y {AÑO_ACTUAL}.</p>", unsafe_allow_html=True)
+    
+    # Análisis 3: Comparación por trimestre
+    st.markdown("<p><strong>Comparación por trimestre (promedio semanal):</strong></p>", unsafe_allow_html=True)
+    
+    for trimestre in resultado.trimestres:
+        if trimestre.anterior is not None and trimestre.actual is not None:
+            change_text = f"({trimestre.porcentaje:+.1f}%)" if trimestre.porcentaje is not None else "(N/A)"
+            st.markdown(f"<p><strong>{trimestre.nombre}:</strong> {AÑO_ANTERIOR}: {trimestre.anterior:.1f} casos/semana, {AÑO_ACTUAL}: {trimestre.actual:.1f} casos/semana {change_text}</p>", unsafe_allow_html=True)
+        elif trimestre.anterior is not None:
+            st.markdown(f"<p><strong>{trimestre.nombre}:</strong> {AÑO_ANTERIOR}: {trimestre.anterior:.1f} casos/semana, {AÑO_ACTUAL}: Sin datos</p>", unsafe_allow_html=True)
+        else:
+            st.markdown(f"<p><strong>{trimestre.nombre}:</strong> {AÑO_ANTERIOR}: Sin datos, {AÑO_ACTUAL}: {trimestre.actual:.1f} casos/semana</p>", unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Análisis dinámico existente
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Análisis de Tendencias Específicas")
+    with perfil.etapa("generate_analysis_text", cacheada=True):
+        analysis_text = textos.generate_analysis_text(CODCOM, VERSION, "Weekly", selected_crime_weekly)
+    st.markdown(f'<div class="dynamic-analysis">{analysis_text}</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@seccion("pestañas")
+def pestañas(pagina):
+    """Selector de temporalidad. En modo perezoso (por defecto) solo corre la pestaña visible:
+    cambiar de pestaña vuelve a correr el script con la nueva pestaña abierta"""
+    tabs = st.tabs(["📊 Anual", "📅 Mensual", "📆 Semanal"], on_change="rerun" if pagina.pestañas_perezosas else "ignore")
+    for tab, contenido in zip(tabs, (pestaña_anual, pestaña_mensual, pestaña_semanal)):
+        with tab:
+            if tab.open is not False:
+                contenido(pagina)
+
+
+def _tarjeta_variacion(variacion):
+    """Clase de color (verde si bajó) y texto de una variación porcentual"""
+    if variacion.porcentaje is None:
+        return "red", "N/A"
+    return ("green" if variacion.porcentaje < 0 else "red"), f"{abs(variacion.porcentaje):.1f}%"
+
+
+@seccion("metricas")
+def metricas(pagina):
+    """Métricas clave de la comuna en dos filas de cuatro tarjetas"""
+    PERIODOS = pagina.periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    
+    st.markdown('<div class="analysis-card">', unsafe_allow_html=True)
+    st.subheader("Métricas Clave de Delincuencia")
+
+    with pagina.perfil.etapa("metricas_clave", cacheada=True):
+        metricas = textos.metricas(pagina.codcom, pagina.version)
+    mostFrequentPrevious, mostFrequentCurrent = metricas.mas_frecuente_anterior, metricas.mas_frecuente_actual
+    robosViolencia = metricas.robos_violencia_mes_corte
+
+    # Mostrar métricas en columnas con diseño mejorado
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">📅</span>
+            <h4 class="title">Total Casos {AÑO_ANTERIOR}</h4>
+            <p class="value">{format_number_chile(metricas.total_anterior)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">📈</span>
+            <h4 class="title">Total Casos {PERIODOS.etiqueta(AÑO_ACTUAL)}</h4>
+            <p class="value">{format_number_chile(metricas.total_actual)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">🚨</span>
+            <h4 class="title">Delito Más Frecuente ({AÑO_ANTERIOR})</h4>
+            <p class="value"><strong>{mostFrequentPrevious.delito}</strong><br>({format_number_chile(mostFrequentPrevious.total)})</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">🔥</span>
+            <h4 class="title">Delito Más Frecuente ({PERIODOS.etiqueta(AÑO_ACTUAL)})</h4>
+            <p class="value"><strong>{mostFrequentCurrent.delito}</strong><br>({format_number_chile(mostFrequentCurrent.total)})</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    col5, col6, col7, col8 = st.columns(4)
+    with col5:
+        color_class, change_text = _tarjeta_variacion(metricas.variacion_mismo_periodo)
+    
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">↔️</span>
+            <h4 class="title">Variación % ({AÑO_ACTUAL} vs Mismo Periodo {AÑO_ANTERIOR})</h4>
+            <p class="value {color_class}">{change_text}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col6:
+        color_class, change_text = _tarjeta_variacion(metricas.variacion_anual)
+    
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">⚡</span>
+            <h4 class="title">Variación % Total ({AÑO_ANTERIOR} vs {AÑO_ANTERIOR - 1})</h4>
+            <p class="value {color_class}">{change_text}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col7:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">🔪</span>
+            <h4 class="title">Robos con Violencia ({robosViolencia.periodo} {AÑO_ACTUAL})</h4>
+            <p class="value">{format_number_chile(robosViolencia.valor)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col8:
+        st.markdown(f"""
+        <div class="metric-card hover-effect">
+            <span class="icon">💀</span>
+            <h4 class="title">Homicidios y Femicidios (Semana 12 {AÑO_ACTUAL})</h4>
+            <p class="value">{format_number_chile(metricas.homicidios_semana12)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@seccion("explicaciones")
+def explicaciones(pagina):
+    COMUNA_NAME = pagina.comuna
+    PERIODOS = pagina.periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    HASTA_MES = textos.hasta_mes(PERIODOS)
+    
+    st.markdown('<div class="explanation-card">', unsafe_allow_html=True)
+    st.subheader("¿Qué son estos gráficos?")
+    st.markdown(f"""
+    Los gráficos muestran la **frecuencia de ocurrencia** de diferentes tipos de delitos en la Comuna de {COMUNA_NAME}. 
+    Esto nos ayuda a identificar patrones y cambios a lo largo del tiempo.
+    - **Gráfico Anual:** Compara la cantidad de casos en los años {", ".join(str(year) for year in PERIODOS.años[:-1])} y lo que va de {AÑO_ACTUAL}.
+    - **Gráfico Mensual y Semanal:** Muestran el número de casos por mes/semana, permitiendo una **comparación directa entre {AÑO_ANTERIOR} y {AÑO_ACTUAL}**.
+      En la vista mensual, los valores futuros de {AÑO_ACTUAL} son proyecciones.
+    """)
+    st.subheader("¿Cómo interpretar las tendencias?")
+    st.markdown(f"""
+    Un **aumento** en la frecuenciapuede indicar un incremento real del delito, una mejora en los reportes, o una mayor actividad policial en ciertas áreas. 
+    Una **disminución** puede sugerir lo contrario.
+    Es crucial considerar el **contexto**: cambios en las leyes, operaciones policiales específicas, factores socioeconómicos, o incluso eventos estacionales pueden influir en estas cifras.
+    💡 **Dato Clave:**
+    Las cifras reales de {AÑO_ACTUAL} están disponibles {HASTA_MES} para la vista mensual y las últimas semanas disponibles para la semanal.
+    Los valores posteriores a {PERIODOS.mes_corte.lower() if PERIODOS.mes_corte else "la fecha"} en el gráfico mensual de {AÑO_ACTUAL} son **proyecciones** basadas en el promedio de los meses ya reportados de {AÑO_ACTUAL}, 
+    y se visualizan con una **línea segmentada**.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@seccion("pie")
+def pie(pagina):
+    st.markdown("""
+    <div class="footer">
+        <p>&copy; 2025 Instituto Libertad. Datos proporcionados por Carabineros de Chile (Plataforma Ley STOP).</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+@seccion("filtro_lateral")
+def filtro_lateral(pagina):
+    """Filtro global de delito en la barra lateral, compartido con las demás páginas de la sesión"""
+    with st.sidebar:
+        st.header("🔍 Filtros")
+        selected_crime = st.selectbox("Selecciona un delito", ["Todos los Delitos"] + list(pagina.crime_types))
+        # Guardamos el valor en session_state para que esté disponible en todas las páginas
+        st.session_state["selected_crime"] = selected_crime
+
+
+@seccion("bienvenida")
+def bienvenida(pagina):
+    """Portada de la aplicación multipágina con el índice del menú lateral"""
+    COMUNA_NAME = pagina.comuna
+    st.title(f"📊 Análisis de Delincuencia en {COMUNA_NAME}")
+    st.markdown(f"""
+Bienvenido al dashboard de análisis delictual en **{COMUNA_NAME}**.  
+
+En el menú lateral puedes navegar a:
+- 📌 Análisis General  
+- 📅 Análisis Anual  
+- 📆 Análisis Mensual  
+- 📈 Análisis Semanal
+""")
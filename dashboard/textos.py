@@ -0,0 +1,197 @@
+"""Textos de análisis (HTML) de las páginas del dashboard.
+
+Los números salen de analisis (sin Streamlit); aquí solo se les da formato. Los resultados se
+cachean en el caché por comuna de charts, con la comuna, la versión de sus datos y los periodos
+reportados en la clave: todas las páginas del proceso comparten el mismo resultado.
+"""
+import analisis
+import instrumentation
+from cache import memoizar
+from charts import CACHE, clave_periodos, format_number_chile, get_data_session
+
+RESUMENES = {
+    "Annual": analisis.resumen_anual,
+    "Monthly": analisis.resumen_mensual,
+    "Weekly": analisis.resumen_semanal,
+}
+
+
+def hasta_mes(PERIODOS):
+    """'hasta <mes>' para el último mes completo del año actual"""
+    return f"hasta {PERIODOS.mes_corte.lower()}" if PERIODOS.mes_corte else "a la fecha"
+
+
+def datos_comuna(codcom, version):
+    """DatosComuna con las tablas del caché por comuna"""
+    return analisis.DatosComuna.cargar(codcom, get_data_session(codcom, version))
+
+
+@memoizar(CACHE, clave_extra=clave_periodos)
+def resumen(codcom, version, temporality, selected_crime):
+    """ResumenAnual, ResumenMensual o ResumenSemanal ("Annual", "Monthly" o "Weekly") de un delito"""
+    instrumentation.marcar_miss()
+    return RESUMENES[temporality](datos_comuna(codcom, version), selected_crime)
+
+
+@memoizar(CACHE, clave_extra=clave_periodos)
+def metricas(codcom, version):
+    """MetricasClave de la comuna"""
+    instrumentation.marcar_miss()
+    return analisis.metricas_clave(datos_comuna(codcom, version))
+
+
+@memoizar(CACHE, clave_extra=clave_periodos)
+def generate_general_analysis(codcom, version):
+    """Tarjetas HTML de la visión general de la comuna (totales, tendencia, extremos)"""
+    instrumentation.marcar_miss()
+    datos = datos_comuna(codcom, version)
+    general = analisis.resumen_general(datos)
+    PERIODOS = datos.periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    HASTA_MES = hasta_mes(PERIODOS)
+
+    # Tendencia general anual, entre cada par de años consecutivos
+    trendText = ""
+    for previousYear, (year, tendencia) in zip(PERIODOS.años, general.tendencias.items()):
+        partial = year == AÑO_ACTUAL and PERIODOS.parcial
+        if tendencia.anterior > 0 and tendencia.actual > 0:
+            change = tendencia.porcentaje
+            if partial:
+                trendText += f"Para el periodo de {PERIODOS.etiqueta(year)} en comparación con el mismo periodo de {previousYear}, se registra un {'aumento' if change > 0 else 'disminución'} del {abs(change):.1f}%."
+            else:
+                trendText += f"Se observó un {'incremento' if change > 0 else 'descenso'} general del {abs(change):.1f}% entre {previousYear} y {year}. "
+        elif partial:
+            trendText += f"Los datos de {year} muestran una tendencia inicial de aumento."
+        else:
+            trendText += f"No hay suficientes datos para calcular la tendencia entre {previousYear} y {year}. "
+
+    annualTotalsHtml = "\n                ".join(
+        f"<p><strong>{PERIODOS.etiqueta(year)}:</strong> {format_number_chile(total)} casos</p>" for year, total in general.totales.items()
+    )
+    mostFrequentCrime, leastFrequentCrime = general.mas_frecuente, general.menos_frecuente
+    monthsPrevious = general.extremos_mensuales_anterior
+
+    # Crear tarjetas en una estructura de 2 columnas
+    cards_html = f"""
+    <div class="metrics-grid">
+        <div class="metric-card hover-effect">
+            <span class="icon">📊</span>
+            <h4 class="title">Cifras Anuales Totales</h4>
+            <div class="value">
+                {annualTotalsHtml}
+            </div>
+        </div>
+        <div class="metric-card hover-effect">
+            <span class="icon">📈</span>
+            <h4 class="title">Tendencia General Anual</h4>
+            <div class="value">{trendText}</div>
+        </div>
+        <div class="metric-card hover-effect">
+            <span class="icon">🚨</span>
+            <h4 class="title">Delitos Más y Menos Frecuentes ({AÑO_ANTERIOR})</h4>
+            <div class="value">
+                <p><strong>Más frecuente:</strong> {mostFrequentCrime.delito} ({format_number_chile(mostFrequentCrime.total)} casos)</p>
+                <p><strong>Menos frecuente:</strong> {leastFrequentCrime.delito} ({format_number_chile(leastFrequentCrime.total)} casos)</p>
+            </div>
+        </div>
+        <div class="metric-card hover-effect">
+            <span class="icon">📅</span>
+            <h4 class="title">Patrones Mensuales (Frecuencia Total)</h4>
+            <div class="value">
+                <p><strong>{AÑO_ANTERIOR} - Mayor frecuencia:</strong> {monthsPrevious.mayor.periodo} ({format_number_chile(monthsPrevious.mayor.valor)} casos)</p>
+                <p><strong>{AÑO_ANTERIOR} - Menor frecuencia:</strong> {monthsPrevious.menor.periodo} ({format_number_chile(monthsPrevious.menor.valor)} casos)</p>
+    """
+
+    monthsCurrent = general.extremos_mensuales_actual
+    if monthsCurrent is not None:
+        cards_html += f"""
+                <p><strong>{AÑO_ACTUAL} ({HASTA_MES}) - Mayor frecuencia:</strong> {monthsCurrent.mayor.periodo} ({format_number_chile(monthsCurrent.mayor.valor)} casos)</p>
+                <p><strong>{AÑO_ACTUAL} ({HASTA_MES}) - Menor frecuencia:</strong> {monthsCurrent.menor.periodo} ({format_number_chile(monthsCurrent.menor.valor)} casos)</p>
+        """
+
+    cards_html += f"""
+            </div>
+        </div>
+        <div class="metric-card hover-effect">
+            <span class="icon">💀</span>
+            <h4 class="title">Datos Específicos de {AÑO_ACTUAL}</h4>
+            <div class="value">
+                <p><strong>Homicidios y Femicidios (Semana 12):</strong> {format_number_chile(general.homicidios_semana12)} casos</p>
+            </div>
+        </div>
+    </div>
+    """
+
+    return cards_html
+
+
+@memoizar(CACHE, clave_extra=clave_periodos)
+def generate_analysis_text(codcom, version, temporality, selected_crime):
+    """Texto HTML del análisis de una pestaña ("Annual", "Monthly" o "Weekly") para un delito"""
+    instrumentation.marcar_miss()
+    PERIODOS = datos_comuna(codcom, version).periodos
+    AÑO_ACTUAL, AÑO_ANTERIOR = PERIODOS.actual, PERIODOS.anterior
+    MESES_COMPLETOS = PERIODOS.meses_completos
+    HASTA_MES = hasta_mes(PERIODOS)
+    resultado = resumen(codcom, version, temporality, selected_crime)
+
+    data_name = "Todos los delitos" if selected_crime == "All" else selected_crime
+
+    if temporality == "Annual":
+        analysis_text = f"Análisis Anual para <strong>{data_name}</strong>:<br><br>"
+        for year, total in resultado.totales.items():
+            if year == AÑO_ACTUAL and PERIODOS.parcial:
+                analysis_text += f"Hasta la fecha en {year}, se han reportado <strong>{format_number_chile(total)}</strong> casos. "
+            else:
+                analysis_text += f"En {year}, se registraron <strong>{format_number_chile(total)}</strong> casos. "
+        analysis_text += "<br><br>"
+
+        for previousYear, (year, change) in zip(PERIODOS.años, resultado.variaciones.items()):
+            if change.porcentaje is not None:
+                analysis_text += f"Entre {previousYear} y {PERIODOS.etiqueta(year)}, se registró un {'aumento' if change.porcentaje > 0 else 'disminución'} del <strong>{abs(change.porcentaje):.1f}%</strong>. "
+            else:
+                analysis_text += f"No hay suficientes datos para calcular la tendencia entre {previousYear} y {PERIODOS.etiqueta(year)}. "
+
+    elif temporality == "Monthly":
+        analysis_text = f"Análisis Mensual para <strong>{data_name}</strong>:<br><br>"
+        analysis_text += f"Comparativa entre {AÑO_ANTERIOR} y {AÑO_ACTUAL} ({HASTA_MES}):<br>"
+
+        changePartial = resultado.variacion.porcentaje
+        if changePartial is not None:
+            analysis_text += f"Se observa un {'incremento' if changePartial > 0 else 'decremento'} del <strong>{abs(changePartial):.1f}%</strong> en {AÑO_ACTUAL} respecto al mismo período de {AÑO_ANTERIOR}.<br>"
+        else:
+            analysis_text += f"Se ha registrado un aumento significativo en {AÑO_ACTUAL} en comparación con el mismo período de {AÑO_ANTERIOR}.<br>"
+
+        maxPrevious, minPrevious = resultado.extremos_anterior
+        analysis_text += f"En {AÑO_ANTERIOR}, el mes con mayor frecuencia fue <strong>{maxPrevious.periodo}</strong> (<strong>{format_number_chile(maxPrevious.valor)}</strong> casos), y el de menor fue <strong>{minPrevious.periodo}</strong> (<strong>{format_number_chile(minPrevious.valor)}</strong> casos).<br>"
+
+        if resultado.extremos_actual is not None:
+            maxCurrent, minCurrent = resultado.extremos_actual
+            analysis_text += f"Hasta el momento en {AÑO_ACTUAL}, el mes de mayor incidencia fue <strong>{maxCurrent.periodo}</strong> (<strong>{format_number_chile(maxCurrent.valor)}</strong> casos), y el de menor fue <strong>{minCurrent.periodo}</strong> (<strong>{format_number_chile(minCurrent.valor)}</strong> casos).<br><br>"
+
+            if resultado.proyeccion is not None:
+                analysis_text += f"La proyección para los meses restantes de {AÑO_ACTUAL} (a partir de <strong>{resultado.proyeccion.desde}</strong>) es de aproximadamente <strong>{format_number_chile(round(resultado.proyeccion.promedio))}</strong> casos por mes, con base en el promedio de los meses ya reportados de {AÑO_ACTUAL}."
+
+    elif temporality == "Weekly":
+        analysis_text = f"Análisis Semanal para <strong>{data_name}</strong>:<br><br>"
+        analysis_text += f"Análisis de las semanas disponibles en {AÑO_ANTERIOR} y {AÑO_ACTUAL}:<br>"
+
+        changePartial = resultado.variacion.porcentaje
+        if changePartial is not None:
+            analysis_text += f"Se observa un {'incremento' if changePartial > 0 else 'decremento'} del <strong>{abs(changePartial):.1f}%</strong> en {AÑO_ACTUAL} respecto al mismo período de {AÑO_ANTERIOR}.<br>"
+        else:
+            analysis_text += f"Se ha registrado un aumento significativo en {AÑO_ACTUAL} en comparación con el mismo período de {AÑO_ANTERIOR}.<br>"
+
+        if resultado.extremos_anterior is not None:
+            max_weekPrevious, min_weekPrevious = resultado.extremos_anterior
+            analysis_text += f"En las semanas disponibles de {AÑO_ANTERIOR}, el pico se alcanzó en la <strong>Semana {max_weekPrevious.periodo}</strong> (<strong>{format_number_chile(max_weekPrevious.valor)}</strong> casos) y el punto más bajo en la <strong>Semana {min_weekPrevious.periodo}</strong> (<strong>{format_number_chile(min_weekPrevious.valor)}</strong> casos).<br>"
+        else:
+            analysis_text += f"No hay datos disponibles para {AÑO_ANTERIOR}.<br>"
+
+        if resultado.extremos_actual is not None:
+            max_weekCurrent, min_weekCurrent = resultado.extremos_actual
+            analysis_text += f"Para {AÑO_ACTUAL}, en las semanas con datos, la semana con más casos fue la <strong>Semana {max_weekCurrent.periodo}</strong> (<strong>{format_number_chile(max_weekCurrent.valor)}</strong> casos) y la de menor fue la <strong>Semana {min_weekCurrent.periodo}</strong> (<strong>{format_number_chile(min_weekCurrent.valor)}</strong> casos)."
+        else:
+            analysis_text += f"No hay datos disponibles para {AÑO_ACTUAL}."
+
+    return analysis_text
@@ -1,5 +1,15 @@
-import pandas as pd
+import os
+import threading
 #import streamlit as st
+from ingest import columnar_compatible, columnar_desactualizado, convertir_xlsx, ingerir_semanas_nuevas, leer_columnar
+from cube import COLUMNAS_CUBO, cargar_cubo, compactar, construir_cubo, guardar_cubo
+
+RUTA_XLSX = os.environ.get("ESTADISTICA_DELITO_XLSX", "ESTADISTICA_DELITO.xlsx")
+RUTA_COLUMNAR = os.environ.get("ESTADISTICA_DELITO_COLUMNAR", os.path.splitext(RUTA_XLSX)[0] + ".parquet")
+RUTA_CUBO = os.environ.get("ESTADISTICA_DELITO_CUBO", os.path.splitext(RUTA_XLSX)[0] + ".cubo.npz")
+# Con ESTADISTICA_DELITO_INCREMENTAL=1, un xlsx más nuevo solo aporta sus semanas nuevas
+# (el libro debe crecer por semanas completas, sin corregir semanas ya publicadas)
+INGESTA_INCREMENTAL = os.environ.get("ESTADISTICA_DELITO_INCREMENTAL") == "1"
 
 comunas = {1101: 'Iquique',
  1107: 'Alto Hospicio',
@@ -355,60 +365,54 @@ def get_comuna(CODCOM):
     
 
 
-#@st.cache_data
-def get_data(CODCOM):
-    df = pd.read_excel("ESTADISTICA_DELITO.xlsx")
-    df_codcom = df[df["codcom"] == CODCOM]
-    df_codcom["año"] = df_codcom["fecha"].dt.year.astype(int)
+# Un único cubo por proceso, compartido por todas las páginas del servidor Streamlit
+_cubo = None
+_cubo_mtime = None
+_columnar_lock = threading.Lock()
+_cubo_lock = threading.Lock()
+
+
+def _asegurar_columnar():
+    # El xlsx solo se vuelve a leer cuando el archivo columnar falta o quedó desactualizado
+    if not columnar_desactualizado(RUTA_XLSX, RUTA_COLUMNAR):
+        return
+    if (
+        INGESTA_INCREMENTAL
+        and columnar_compatible(RUTA_COLUMNAR)
+        and os.path.exists(RUTA_CUBO)
+        and os.path.getmtime(RUTA_CUBO) >= os.path.getmtime(RUTA_COLUMNAR)
+    ):
+        ingerir_semanas_nuevas(RUTA_XLSX, RUTA_COLUMNAR, RUTA_CUBO)
+    else:
+        convertir_xlsx(RUTA_XLSX, RUTA_COLUMNAR)
 
-    pivot = df_codcom[["delito","frecuencia",'codcom','año']].pivot_table(
-        index=["delito", "codcom"], # lo que se mantiene como índice
-        columns="año", # lo que pasa a ser columnas
-        values="frecuencia", # los valores que llenan la tabla
-        aggfunc="sum", # cómo se agregan si hay duplicados
-        fill_value=0 # rellena NaN con 0
-    ).reset_index()
-    pivot.columns = ["Delito","codcom", "Frecuencia 2023", "Frecuencia 2024", "Frecuencia 2025 (a la fecha)"]
 
-    meses = {
-        1: "Enero",
-        2: "Febrero",
-        3: "Marzo",
-        4: "Abril",
-        5: "Mayo",
-        6: "Junio",
-        7: "Julio",
-        8: "Agosto",
-        9: "Septiembre",
-        10: "Octubre",
-        11: "Noviembre",
-        12: "Diciembre"
-    }
-    df_codcom["meses"] = df_codcom["fecha"].dt.month
-    df_codcom["meses_str"] = df_codcom["meses"].map(meses)
+def get_cubo():
+    global _cubo, _cubo_mtime
+    with _cubo_lock:
+        # Con el cubo al día no se lee la tabla nacional: solo se recalcula si sus fuentes cambiaron,
+        # y entonces solo con las columnas que agrega, en su representación compacta
+        with _columnar_lock:
+            _asegurar_columnar()
+        if not os.path.exists(RUTA_CUBO) or os.path.getmtime(RUTA_CUBO) < os.path.getmtime(RUTA_COLUMNAR):
+            guardar_cubo(construir_cubo(compactar(leer_columnar(RUTA_COLUMNAR, COLUMNAS_CUBO, delito_categorico=True))), RUTA_CUBO)
+        mtime = os.path.getmtime(RUTA_CUBO)
+        if _cubo is None or mtime != _cubo_mtime:
+            _cubo = cargar_cubo(RUTA_CUBO)
+            _cubo_mtime = mtime
+        return _cubo
 
-    pivot2 = df_codcom[df_codcom["año"] > 2023][['delito', 'frecuencia', 'año', 'meses_str']].pivot_table(
-        index=["delito", "año"], # lo que se mantiene como índice
-        columns="meses_str", # lo que pasa a ser columnas
-        values="frecuencia", # los valores que llenan la tabla
-        aggfunc="sum", # cómo se agregan si hay duplicados
-        fill_value=0 # rellena NaN con 0
-    ).reset_index()
-    pivot2 = pivot2[['delito', 'año', "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"]]
-    pivot2.columns = ["Delito", "Año", "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio", "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"]
 
-    def get_semana(fila):
-        semana_detalle = fila["semana_detalle"][:9]
-        anio = fila["año"]
-        return f"{anio} - {semana_detalle}"
-    df_codcom["semana"] = df_codcom.apply(get_semana, axis=1)
+def get_periodos():
+    """Años con datos y último mes/semana reportados, descubiertos desde los datos"""
+    return get_cubo().periodos()
 
-    pivot3 = df_codcom[df_codcom["año"] > 2023][['delito', 'frecuencia', 'año', 'semana']].pivot_table(
-        index=["delito", "año"], # lo que se mantiene como índice
-        columns="semana", # lo que pasa a ser columnas
-        values="frecuencia", # los valores que llenan la tabla
-        aggfunc="sum", # cómo se agregan si hay duplicados
-        fill_value=0 # rellena NaN con 0
-    ).reset_index()
-    pivot3 = pivot3[["delito","año"] + sorted(pivot3.columns[2:])]
-    return pivot, pivot2, pivot3
\ No newline at end of file
+
+def version_comuna(CODCOM):
+    """Versión de los datos de una comuna: cambia solo cuando una ingesta la toca"""
+    return get_cubo().version(CODCOM)
+
+
+#@st.cache_data
+def get_data(CODCOM):
+    return get_cubo().tablas(CODCOM)
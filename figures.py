@@ -0,0 +1,155 @@
+"""Plantillas de figuras Plotly para los gráficos del dashboard.
+
+El estilo de cada tipo de gráfico (layout, fuentes, colores, leyenda, hovertemplate) se valida
+y serializa una sola vez por proceso; cada figura solo inyecta sus arreglos y su título en la
+especificación JSON, sin construir ni validar un go.Figure. Los números se formatean en el
+navegador con separadores chilenos (layout.separators), en lugar de mandar una lista de
+textos por punto.
+"""
+import functools
+import json
+
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+
+# Separador decimal y de miles del formato chileno (1.234,5)
+SEPARADORES = ",."
+
+# JSON sin espacios
+COMPACTO = (",", ":")
+
+FUENTE_EJES = dict(size=14, color='#4b5563', family='Inter')
+
+LAYOUT_BASE = dict(
+    title_font=dict(size=22, color='#1e40af', family='Inter'),
+    yaxis_title="Frecuencia de Casos",
+    height=500,
+    separators=SEPARADORES,
+    yaxis=dict(
+        tickformat=",d",
+        tickfont=FUENTE_EJES
+    ),
+    xaxis=dict(tickfont=FUENTE_EJES),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    margin=dict(l=50, r=50, t=80, b=60),
+)
+
+LEYENDA = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1,
+    font=dict(size=14, family='Inter')
+)
+
+
+def _a_lista(valor):
+    # Arreglos y escalares de NumPy
+    return valor.tolist()
+
+
+def _unir(objeto, otro):
+    """Une dos objetos JSON ya serializados que no comparten claves"""
+    if objeto == "{}":
+        return otro
+    if otro == "{}":
+        return objeto
+    return objeto[:-1] + "," + otro[1:]
+
+
+class FiguraJSON:
+    """Especificación final de una figura, serializada una sola vez como JSON compacto.
+
+    Es lo que se cachea en lugar del go.Figure: un hit no copia ni vuelve a serializar la figura
+    """
+
+    def __init__(self, spec, alto):
+        self.spec = spec
+        self.alto = alto
+
+
+class Plantilla:
+    """Figura con estilo fijo; `variables` son las claves de cada traza que se inyectan por figura"""
+
+    def __init__(self, trazas, layout, variables=("x", "y", "name")):
+        spec = go.Figure(data=trazas, layout=layout).to_plotly_json()
+        self._trazas = [
+            json.dumps({k: v for k, v in traza.items() if k not in variables}, cls=PlotlyJSONEncoder, separators=COMPACTO)
+            for traza in spec["data"]
+        ]
+        layout = spec["layout"]
+        self._titulo = layout.pop("title", {})
+        self._layout = json.dumps(layout, cls=PlotlyJSONEncoder, separators=COMPACTO)
+        self.alto = layout.get("height") or 450
+
+    def figura(self, titulo, trazas):
+        """FiguraJSON con un dict de valores por traza (listas o arreglos NumPy), en orden"""
+        data = ",".join(
+            _unir(json.dumps(valores, default=_a_lista, separators=COMPACTO), estilo)
+            for valores, estilo in zip(trazas, self._trazas)
+        )
+        layout = _unir(json.dumps({"title": {**self._titulo, "text": titulo}}, separators=COMPACTO), self._layout)
+        spec = '{"data":[' + data + '],"layout":' + layout + '}'
+        return FiguraJSON(spec.encode(), self.alto)
+
+
+def _linea(color, **estilo):
+    return dict(
+        mode='lines+markers',
+        line=dict(color=color, width=4, **estilo.pop("line", {})),
+        marker=dict(size=10, color=color, line=dict(width=2, color='white'), **estilo.pop("marker", {})),
+        **estilo
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def anual():
+    """Barras por año; cada figura inyecta x, y y el color de cada barra (marker)"""
+    return Plantilla(
+        [go.Bar(
+            name='Frecuencia',
+            showlegend=False,
+            textposition='auto',
+            texttemplate='%{y:,d}',
+            textfont=dict(size=14, color='#1e40af')
+        )],
+        dict(
+            LAYOUT_BASE,
+            xaxis_title="Año",
+            xaxis=dict(type='category', tickfont=FUENTE_EJES),
+            uniformtext_minsize=12,
+            uniformtext_mode='hide'
+        ),
+        variables=("x", "y", "marker"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def mensual():
+    """Año anterior, año actual (datos reales) y proyección del año actual"""
+    return Plantilla(
+        [
+            go.Scatter(**_linea('#3b82f6'), hovertemplate='%{y:,d}<extra></extra>'),
+            go.Scatter(**_linea('#60a5fa'), hovertemplate='%{y:,d}<extra></extra>', showlegend=False),
+            go.Scatter(
+                **_linea('#60a5fa', line=dict(dash='dash'), marker=dict(symbol='diamond')),
+                hovertemplate='Proy: %{y:,d}<extra></extra>',
+                showlegend=False
+            ),
+        ],
+        dict(LAYOUT_BASE, xaxis_title="Mes", hovermode='x unified', legend=LEYENDA),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def semanal():
+    """Año anterior y año actual por número de semana"""
+    return Plantilla(
+        [
+            go.Scatter(**_linea('#3b82f6'), hovertemplate='Semana %{x}: %{y:,d}<extra></extra>'),
+            go.Scatter(**_linea('#60a5fa'), hovertemplate='Semana %{x}: %{y:,d}<extra></extra>'),
+        ],
+        dict(LAYOUT_BASE, xaxis_title="Semana", hovermode='x unified', legend=LEYENDA),
+    )
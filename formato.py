@@ -0,0 +1,58 @@
+"""Formato chileno de números: punto como separador de miles (1.234.567).
+
+miles() formatea un arreglo, lista o Series completo de una vez y numero() un solo valor.
+Los enteros pequeños, que son la gran mayoría de las frecuencias de delitos, salen de una
+tabla precalculada en lugar de formatearse cada vez.
+"""
+import math
+import numbers
+
+import numpy as np
+import pandas as pd
+
+# Enteros de 0 a MAX_MEMO - 1 con su texto ya formateado
+MAX_MEMO = 10_000
+_MEMO = np.array([f"{i:,}".replace(",", ".") for i in range(MAX_MEMO)], dtype=object)
+_MEMO_LISTA = _MEMO.tolist()
+
+# Posiciones donde va un separador: antes de cada grupo de tres dígitos hasta el final
+_SEPARADOR_MILES = r"\B(?=(\d{3})+(?!\d))"
+
+
+def miles(valores):
+    """Arreglo de textos (dtype object) con los valores redondeados a entero y punto de miles"""
+    numeros = np.asarray(valores)
+    if numeros.dtype.kind in "iub":
+        finitos = np.ones(numeros.shape, dtype=bool)
+        enteros = numeros.astype(np.int64)
+    else:
+        numeros = numeros.astype(float)
+        finitos = np.isfinite(numeros)
+        enteros = np.zeros(numeros.shape, dtype=np.int64)
+        enteros[finitos] = np.rint(numeros[finitos])
+
+    resultado = np.empty(numeros.shape, dtype=object)
+    en_memo = finitos & (enteros >= 0) & (enteros < MAX_MEMO)
+    resultado[en_memo] = _MEMO[enteros[en_memo]]
+    resto = finitos & ~en_memo
+    if resto.any():
+        texto = pd.Series(enteros[resto].astype(str))
+        resultado[resto] = texto.str.replace(_SEPARADOR_MILES, ".", regex=True).to_numpy()
+    if not finitos.all():
+        resultado[~finitos] = numeros[~finitos].astype(str)
+    return resultado
+
+
+def numero(valor):
+    """Formatea un número con puntos como separadores de miles; lo que no es número se devuelve igual"""
+    if not isinstance(valor, numbers.Real):
+        return valor
+    if isinstance(valor, numbers.Integral):
+        entero = int(valor)
+    elif math.isfinite(valor):
+        entero = round(valor)
+    else:
+        return "{:,.0f}".format(valor)
+    if 0 <= entero < MAX_MEMO:
+        return _MEMO_LISTA[entero]
+    return f"{entero:,}".replace(",", ".")
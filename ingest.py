@@ -0,0 +1,224 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Esquema tipado del archivo columnar (mismas columnas que ESTADISTICA_DELITO.xlsx)
+ESQUEMA = pa.schema([
+    ("delito", pa.dictionary(pa.int8(), pa.string())),
+    ("frecuencia", pa.int32()),
+    ("codcom", pa.int32()),
+    ("id_semana", pa.int32()),
+    ("semana_detalle", pa.string()),
+    ("fecha", pa.timestamp("ms")),
+    ("fecha_str", pa.string()),
+    ("año", pa.int16()),
+    ("semana", pa.int8()),
+])
+
+# Filas por row group: con el archivo ordenado por codcom, un filtro por comuna
+# solo lee los row groups cuyo rango de codcom contiene la comuna pedida
+FILAS_POR_GRUPO = 16384
+
+# Filas del xlsx que se acumulan antes de tipar y escribir un lote: acota la memoria de la ingesta
+FILAS_POR_LOTE = 50_000
+
+
+def columnar_compatible(ruta_columnar):
+    """Indica si el archivo columnar existe y tiene las columnas del esquema actual"""
+    return os.path.exists(ruta_columnar) and pq.read_schema(ruta_columnar).names == ESQUEMA.names
+
+
+def columnar_desactualizado(ruta_xlsx, ruta_columnar):
+    """Indica si el archivo columnar falta o es más antiguo que el xlsx de origen.
+
+    Sin el xlsx un archivo columnar compatible se usa tal cual; uno que falta o que no es
+    compatible no se puede reconstruir, y se avisa con FileNotFoundError.
+    """
+    if not os.path.exists(ruta_xlsx):
+        if columnar_compatible(ruta_columnar):
+            return False
+        motivo = "no es compatible con el esquema actual" if os.path.exists(ruta_columnar) else "no existe"
+        raise FileNotFoundError(f"El archivo columnar {ruta_columnar} {motivo} y no está {ruta_xlsx} para reconstruirlo")
+    if not columnar_compatible(ruta_columnar):
+        return True
+    return os.path.getmtime(ruta_columnar) < os.path.getmtime(ruta_xlsx)
+
+
+def tabla_desde_dataframe(df):
+    """Convierte un DataFrame con el esquema de ESTADISTICA_DELITO en una tabla tipada ordenada por codcom"""
+    df = df.copy()
+    df["fecha"] = pd.to_datetime(df["fecha"])
+    if "año" not in df.columns:
+        df["año"] = df["fecha"].dt.year
+    # Número de semana como entero, extraído de "SEMANA NN/YYYY (del … al …)" de una sola vez
+    df["semana"] = df["semana_detalle"].str.extract(r"SEMANA (\d+)/", expand=False).astype(int)
+    df = df.sort_values(["codcom", "id_semana"], kind="stable")
+    columnas = [campo.name for campo in ESQUEMA]
+    return pa.Table.from_pandas(df[columnas], schema=ESQUEMA, preserve_index=False)
+
+
+def escribir_columnar(tabla, ruta_columnar):
+    """Escribe la tabla en Parquet de forma atómica (archivo temporal + rename)"""
+    temporal = f"{ruta_columnar}.tmp"
+    pq.write_table(tabla, temporal, row_group_size=FILAS_POR_GRUPO, compression="zstd")
+    os.replace(temporal, ruta_columnar)
+
+
+def agregar_columnar(nuevas, ruta_columnar):
+    """Agrega filas nuevas al archivo columnar sin cargar la tabla nacional (escritura atómica).
+
+    Los row groups existentes se leen de a uno y se intercalan con las filas nuevas de las
+    mismas comunas, así el archivo sigue ordenado por codcom e id_semana. La memoria pico es
+    la de un row group más las filas de una comuna, no la del archivo.
+    """
+    nuevas = nuevas.sort_by([("codcom", "ascending"), ("id_semana", "ascending")])
+    codcom_nuevas = nuevas.column("codcom").to_numpy()
+    desde = 0
+
+    def intercalar(tabla, hasta):
+        # Filas existentes más las nuevas de las comunas anteriores a `hasta` (None: todas las que quedan)
+        nonlocal desde
+        fin = len(nuevas) if hasta is None else int(np.searchsorted(codcom_nuevas, hasta))
+        tabla = pa.concat_tables([tabla, nuevas.slice(desde, fin - desde)]).unify_dictionaries()
+        desde = fin
+        return tabla.sort_by([("codcom", "ascending"), ("id_semana", "ascending")]).combine_chunks()
+
+    archivo = pq.ParquetFile(ruta_columnar)
+    temporal = f"{ruta_columnar}.tmp"
+    with pq.ParquetWriter(temporal, ESQUEMA, compression="zstd") as escritor:
+        # Filas ya ordenadas que esperan completar un row group de FILAS_POR_GRUPO
+        salida = ESQUEMA.empty_table()
+
+        def escribir(tabla):
+            nonlocal salida
+            salida = pa.concat_tables([salida, tabla])
+            completos = len(salida) // FILAS_POR_GRUPO * FILAS_POR_GRUPO
+            if completos:
+                escritor.write_table(salida.slice(0, completos).unify_dictionaries(), row_group_size=FILAS_POR_GRUPO)
+                salida = salida.slice(completos)
+
+        # Filas de la última comuna del row group anterior: pueden seguir en el siguiente
+        pendiente = ESQUEMA.empty_table()
+        for i in range(archivo.num_row_groups):
+            grupo = pa.concat_tables([pendiente, archivo.read_row_group(i).cast(ESQUEMA)])
+            codcoms = grupo.column("codcom").to_numpy()
+            corte = int(np.searchsorted(codcoms, codcoms[-1]))
+            pendiente = grupo.slice(corte)
+            if corte:
+                escribir(intercalar(grupo.slice(0, corte), codcoms[-1]))
+        escribir(intercalar(pendiente, None))
+        escritor.write_table(salida.unify_dictionaries(), row_group_size=FILAS_POR_GRUPO)
+    os.replace(temporal, ruta_columnar)
+
+
+def leer_xlsx_por_lotes(ruta_xlsx, excluir_semanas=None, filas_por_lote=FILAS_POR_LOTE):
+    """Recorre la hoja fila a fila (openpyxl en modo read-only) y entrega DataFrames de a lo más filas_por_lote filas.
+
+    Con excluir_semanas se descartan al vuelo las filas de los id_semana ya ingeridos.
+    """
+    from openpyxl import load_workbook
+
+    libro = load_workbook(ruta_xlsx, read_only=True, data_only=True)
+    try:
+        filas = libro.active.iter_rows(values_only=True)
+        encabezado = [str(columna) for columna in next(filas)]
+        i_codcom = encabezado.index("codcom")
+        i_semana = encabezado.index("id_semana")
+        lote = []
+        for fila in filas:
+            if fila[i_codcom] is None:
+                continue
+            if excluir_semanas is not None and fila[i_semana] in excluir_semanas:
+                continue
+            lote.append(fila)
+            if len(lote) >= filas_por_lote:
+                yield pd.DataFrame(lote, columns=encabezado)
+                lote = []
+        if lote:
+            yield pd.DataFrame(lote, columns=encabezado)
+    finally:
+        libro.close()
+
+
+def convertir_xlsx(ruta_xlsx, ruta_columnar, filas_por_lote=FILAS_POR_LOTE):
+    """Convierte el libro a formato columnar sin cargarlo entero en memoria.
+
+    Los lotes se reparten por región (codcom // 1000) en archivos temporales; luego cada
+    región se ordena por separado y se agrega al archivo final, que queda ordenado por
+    codcom. La memoria pico es la de un lote o la de la región más grande, no la del libro.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta_columnar))
+    with tempfile.TemporaryDirectory(dir=directorio) as temporal:
+        particiones = {}
+        try:
+            for lote in leer_xlsx_por_lotes(ruta_xlsx, filas_por_lote=filas_por_lote):
+                for region, grupo in lote.groupby(lote["codcom"] // 1000):
+                    if region not in particiones:
+                        particiones[region] = pq.ParquetWriter(os.path.join(temporal, f"{region}.parquet"), ESQUEMA)
+                    particiones[region].write_table(tabla_desde_dataframe(grupo))
+        finally:
+            for escritor in particiones.values():
+                escritor.close()
+
+        destino = f"{ruta_columnar}.tmp"
+        with pq.ParquetWriter(destino, ESQUEMA, compression="zstd") as escritor:
+            for region in sorted(particiones):
+                tabla = pq.read_table(os.path.join(temporal, f"{region}.parquet"))
+                escritor.write_table(tabla.sort_by([("codcom", "ascending"), ("id_semana", "ascending")]), row_group_size=FILAS_POR_GRUPO)
+        os.replace(destino, ruta_columnar)
+
+
+def ingerir_semanas_nuevas(ruta_xlsx, ruta_columnar, ruta_cubo):
+    """Ingesta incremental: agrega al archivo columnar y al cubo solo los id_semana que aún no tienen.
+
+    Supone que el libro solo crece por semanas completas; las filas de semanas ya ingeridas
+    no se vuelven a leer. Devuelve los codcom cuyos datos cambiaron.
+    """
+    from cube import COLUMNAS_CUBO, cargar_cubo, compactar, construir_cubo, fusionar_cubos, guardar_cubo
+
+    conocidas = set(pq.read_table(ruta_columnar, columns=["id_semana"]).column("id_semana").unique().to_pylist())
+    lotes = [tabla_desde_dataframe(lote) for lote in leer_xlsx_por_lotes(ruta_xlsx, excluir_semanas=conocidas)]
+    if not lotes:
+        # Nada nuevo: se marcan los derivados como al día respecto del xlsx
+        os.utime(ruta_columnar)
+        os.utime(ruta_cubo)
+        return []
+
+    nuevas = pa.concat_tables(lotes).unify_dictionaries()
+    agregar_columnar(nuevas, ruta_columnar)
+
+    cubo = fusionar_cubos(cargar_cubo(ruta_cubo), construir_cubo(compactar(nuevas.select(COLUMNAS_CUBO).to_pandas())))
+    guardar_cubo(cubo, ruta_cubo)
+    return sorted(pc.unique(nuevas.column("codcom")).to_pylist())
+
+
+def leer_columnar(ruta_columnar, columnas=None, delito_categorico=False):
+    """Lee la tabla nacional desde el archivo columnar (todas las columnas o solo las pedidas)"""
+    df = pq.read_table(ruta_columnar, columns=columnas).to_pandas()
+    if "delito" in df.columns and not delito_categorico:
+        df["delito"] = df["delito"].astype(str)
+    return df
+
+
+if __name__ == "__main__":
+    # Uso: python ingest.py [--incremental] [ESTADISTICA_DELITO.xlsx]
+    # Genera el archivo columnar y el cubo de agregados (trabajo batch, fuera del servidor).
+    # Con --incremental solo se agregan las semanas nuevas a los archivos existentes
+    from cube import COLUMNAS_CUBO, compactar, construir_cubo, guardar_cubo
+
+    argumentos = [a for a in sys.argv[1:] if a != "--incremental"]
+    ruta_xlsx = argumentos[0] if argumentos else "ESTADISTICA_DELITO.xlsx"
+    base = os.path.splitext(ruta_xlsx)[0]
+    if "--incremental" in sys.argv and os.path.exists(f"{base}.parquet") and os.path.exists(f"{base}.cubo.npz"):
+        cambiadas = ingerir_semanas_nuevas(ruta_xlsx, f"{base}.parquet", f"{base}.cubo.npz")
+        print(f"{ruta_xlsx}: {len(cambiadas)} comunas con semanas nuevas")
+        sys.exit(0)
+    convertir_xlsx(ruta_xlsx, f"{base}.parquet")
+    guardar_cubo(construir_cubo(compactar(leer_columnar(f"{base}.parquet", COLUMNAS_CUBO, delito_categorico=True))), f"{base}.cubo.npz")
+    print(f"{ruta_xlsx} -> {base}.parquet, {base}.cubo.npz")
@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# Muestras retenidas por comuna para calcular percentiles (ventana deslizante)
+MAX_MUESTRAS_POR_COMUNA = 1000
+
+_hooks = []
+_tiempos_carga = defaultdict(lambda: deque(maxlen=MAX_MUESTRAS_POR_COMUNA))
+_lock = threading.Lock()
+
+
+def registrar_hook(hook):
+    """Registra una función hook(codcom, segundos) que se llama en cada carga real de datos"""
+    _hooks.append(hook)
+    return hook
+
+
+def registrar_carga(codcom, segundos):
+    """Anota el tiempo real de una carga de datos (solo cache miss) y avisa a los hooks"""
+    with _lock:
+        _tiempos_carga[codcom].append(segundos)
+    for hook in list(_hooks):
+        hook(codcom, segundos)
+
+
+def percentiles_carga(codcom=None):
+    """p50/p95 del tiempo de carga en segundos, para una comuna o para todas"""
+    with _lock:
+        if codcom is None:
+            muestras = [t for tiempos in _tiempos_carga.values() for t in tiempos]
+        else:
+            muestras = list(_tiempos_carga.get(codcom, ()))
+    if not muestras:
+        return {"n": 0, "p50": None, "p95": None}
+    p50, p95 = np.percentile(muestras, [50, 95])
+    return {"n": len(muestras), "p50": float(p50), "p95": float(p95)}
+
+
+# ===== Perfil por rerun =====
+# Ruta opcional de exportación: cada rerun se agrega como una línea JSON
+RUTA_PERFIL_JSONL = os.environ.get("DELITO_PERFIL_JSONL")
+MAX_PERFILES = 200
+
+_perfiles = deque(maxlen=MAX_PERFILES)
+_local = threading.local()
+
+
+class PerfilRerun:
+    """Etapas de un rerun del script: tiempo de pared, cache hit/miss y filas por etapa"""
+
+    def __init__(self, script, codcom):
+        self.script = script
+        self.codcom = codcom
+        self.inicio = time.time()
+        self._t0 = time.perf_counter()
+        self.etapas = []
+        self.total = None
+
+    @contextmanager
+    def etapa(self, nombre, filas=None, cacheada=False):
+        # En una etapa cacheada se asume hit, salvo que la función avise un miss con marcar_miss()
+        registro = {"etapa": nombre, "segundos": None, "cache": "hit" if cacheada else None, "filas": filas}
+        anterior = getattr(_local, "etapa", None)
+        _local.etapa = registro
+        t0 = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            registro["segundos"] = time.perf_counter() - t0
+            _local.etapa = anterior
+            self.etapas.append(registro)
+
+    def finalizar(self):
+        self.total = time.perf_counter() - self._t0
+        with _lock:
+            _perfiles.append(self)
+        if RUTA_PERFIL_JSONL:
+            with open(RUTA_PERFIL_JSONL, "a", encoding="utf-8") as archivo:
+                archivo.write(self.a_json() + "\n")
+        return self
+
+    def a_dict(self):
+        return {
+            "script": self.script,
+            "codcom": self.codcom,
+            "inicio": self.inicio,
+            "total": self.total,
+            "etapas": self.etapas,
+        }
+
+    def a_json(self):
+        return json.dumps(self.a_dict(), ensure_ascii=False, default=str)
+
+
+def marcar_miss(filas=None):
+    """Llamar dentro del cuerpo de una función cacheada: solo se ejecuta en un cache miss"""
+    registro = getattr(_local, "etapa", None)
+    if registro is not None:
+        registro["cache"] = "miss"
+        if filas is not None:
+            registro["filas"] = int(filas)
+
+
+def perfiles():
+    """Copia de los perfiles retenidos en memoria (del más antiguo al más reciente)"""
+    with _lock:
+        return list(_perfiles)
+
+
+def limpiar_perfiles():
+    with _lock:
+        _perfiles.clear()
+
+
+def perfiles_jsonl():
+    """Perfiles retenidos en memoria, uno por línea JSON"""
+    with _lock:
+        return "\n".join(perfil.a_json() for perfil in _perfiles)
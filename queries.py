@@ -0,0 +1,20 @@
+from cache import CACHE, memoizar
+from data import get_cubo, version_comuna
+
+
+# Matrices por comuna en el caché del proceso (acotado en bytes, con sus contadores en el panel
+# de depuración). La versión de la comuna va en la clave: al recargar el cubo solo dejan de
+# usarse las matrices de las comunas cuya versión cambió, y el LRU las desaloja
+@memoizar(CACHE)
+def _matriz(CODCOM, version, crime, granularidad):
+    return get_cubo().matriz(CODCOM, crime, granularidad)
+
+
+def matriz_mensual(CODCOM, crime="All"):
+    """Matriz (año × mes) de una comuna: una sola consulta para todos los años"""
+    return _matriz(CODCOM, version_comuna(CODCOM), crime, "mensual")
+
+
+def matriz_semanal(CODCOM, crime="All"):
+    """Matriz (año × semana) de una comuna; la columna es el número de semana"""
+    return _matriz(CODCOM, version_comuna(CODCOM), crime, "semanal")
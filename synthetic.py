@@ -0,0 +1,268 @@
+"""Generador de datasets sintéticos con el esquema de ESTADISTICA_DELITO.xlsx.
+
+Uso: python synthetic.py [--comunas N] [--desde 2023-01-01] [--hasta 2025-08-10] [--sesgo 1.0]
+                         [--seed 0] [--formatos xlsx csv parquet] [--salida ESTADISTICA_DELITO_SINTETICO]
+     python synthetic.py --escenarios [un_año incremental]
+
+Una fila por (semana, comuna, delito) para las comunas de data.comunas, con las mismas
+columnas y formatos que el archivo real, para poder correr pruebas de carga sin él.
+Los escenarios (ESCENARIOS) arman datasets con casos borde y verifican el pipeline sobre
+ellos; fallan con AssertionError.
+"""
+import argparse
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+# Delitos del archivo real con su frecuencia semanal media en una comuna típica
+TASAS_DELITO = {
+    "AMENAZAS CON ARMAS": 0.1,
+    "AMENAZAS Y RIÑAS": 16.2,
+    "CONSUMO DE ALCOHOL Y DE DROGAS EN LA VÍA PÚBLICA": 5.8,
+    "DAÑOS": 4.4,
+    "DELITOS EN CONTEXTO DE VIOLENCIA INTRAFAMILIAR": 1.7,
+    "HOMICIDIOS Y FEMICIDIOS": 0.7,
+    "HURTOS": 6.9,
+    "INCIVILIDADES": 0.4,
+    "LESIONES GRAVES": 0.1,
+    "LESIONES LEVES": 1.2,
+    "LESIONES MENOS GRAVES": 0.1,
+    "LEY DE CONTROL DE ARMAS": 0.3,
+    "LEY DE DROGAS": 0.5,
+    "OTROS DESÓRDENES PÚBLICOS": 0.1,
+    "OTROS ROBOS CON FUERZA EN LAS COSAS": 0.1,
+    "RECEPTACIÓN": 0.3,
+    "ROBOS CON VIOLENCIA E INTIMIDACIÓN": 2.5,
+    "ROBOS DE VEHÍCULOS Y SUS ACCESORIOS": 0.6,
+    "ROBOS EN LUGARES HABITADOS Y NO HABITADOS": 15.0,
+    "ROBOS POR SORPRESA": 1.3,
+    "VIOLACIONES Y DELITOS SEXUALES": 1.2,
+}
+
+COLUMNAS = ["delito", "frecuencia", "codcom", "id_semana", "semana_detalle", "fecha", "fecha_str", "año"]
+
+# Límite de filas de una hoja de Excel (sin contar el encabezado)
+MAX_FILAS_XLSX = 1_048_575
+
+
+def semanas(desde, hasta):
+    """Semanas lunes-domingo recortadas a cada año calendario y numeradas desde 1 en cada año, como en la fuente"""
+    resultado = []
+    for año in range(desde.year, hasta.year + 1):
+        inicio_año = datetime.date(año, 1, 1)
+        fin_año = datetime.date(año, 12, 31)
+        lunes = inicio_año - datetime.timedelta(days=inicio_año.weekday())
+        numero = 1
+        while lunes <= fin_año:
+            inicio = max(lunes, inicio_año)
+            fin = min(lunes + datetime.timedelta(days=6), fin_año)
+            if desde <= inicio <= hasta:
+                resultado.append((año, numero, inicio, fin))
+            lunes += datetime.timedelta(days=7)
+            numero += 1
+    return resultado
+
+
+def _nombres_delito(n_delitos):
+    nombres = list(TASAS_DELITO)[:n_delitos]
+    nombres += [f"DELITO SINTÉTICO {i:02d}" for i in range(len(nombres), n_delitos)]
+    tasas = [TASAS_DELITO.get(nombre, 1.0) for nombre in nombres]
+    return np.array(nombres), np.array(tasas)
+
+
+def dataset_sintetico(codcoms, n_delitos=len(TASAS_DELITO), desde=datetime.date(2023, 1, 1), hasta=datetime.date(2025, 8, 10), sesgo=1.0, seed=0):
+    """DataFrame con el esquema de ESTADISTICA_DELITO: una fila por (semana, comuna, delito).
+
+    sesgo controla la concentración entre comunas: la escala de cada comuna sigue una ley
+    de Zipf con ese exponente (0 = todas iguales; 1 = pocas comunas concentran la mayoría).
+    """
+    rng = np.random.default_rng(seed)
+    lista_semanas = semanas(desde, hasta)
+    delitos, tasas = _nombres_delito(n_delitos)
+    S, C, D = len(lista_semanas), len(codcoms), len(delitos)
+
+    s_idx = np.repeat(np.arange(S), C * D)
+    c_idx = np.tile(np.repeat(np.arange(C), D), S)
+    d_idx = np.tile(np.arange(D), S * C)
+
+    # Escala por comuna (Zipf sobre un orden aleatorio, media 1) y ruido por (comuna, delito)
+    escala_comuna = (rng.permutation(C) + 1.0) ** -sesgo
+    escala_comuna *= C / escala_comuna.sum()
+    escala = tasas[None, :] * escala_comuna[:, None] * rng.gamma(4.0, 0.25, size=(C, D))
+    frecuencia = rng.poisson(escala[c_idx, d_idx])
+
+    detalle = np.array([
+        f"SEMANA {numero:02d}/{año} (del {inicio:%d/%m/%Y} al {fin:%d/%m/%Y})" for año, numero, inicio, fin in lista_semanas
+    ])
+    fechas = np.array([inicio for _, _, inicio, _ in lista_semanas], dtype="datetime64[ns]")
+    return pd.DataFrame({
+        "delito": delitos[d_idx],
+        "frecuencia": frecuencia,
+        "codcom": np.asarray(codcoms)[c_idx],
+        "id_semana": s_idx + 1,
+        "semana_detalle": detalle[s_idx],
+        "fecha": fechas[s_idx],
+        "fecha_str": pd.to_datetime(fechas).strftime("%d/%m/%Y").to_numpy()[s_idx],
+        "año": np.array([año for año, _, _, _ in lista_semanas])[s_idx],
+    })
+
+
+def escribir_xlsx(df, ruta):
+    """Escribe el libro en modo write-only de openpyxl (fila a fila, sin mantener la hoja en memoria)"""
+    from openpyxl import Workbook
+
+    if len(df) > MAX_FILAS_XLSX:
+        raise ValueError(f"{len(df):,} filas no caben en una hoja de Excel (máximo {MAX_FILAS_XLSX:,}); use csv o parquet")
+    libro = Workbook(write_only=True)
+    hoja = libro.create_sheet()
+    hoja.append(COLUMNAS)
+    columnas = [df[columna].tolist() for columna in COLUMNAS]
+    columnas[COLUMNAS.index("fecha")] = df["fecha"].dt.to_pydatetime().tolist()
+    for fila in zip(*columnas):
+        hoja.append(fila)
+    temporal = f"{ruta}.tmp"
+    libro.save(temporal)
+    os.replace(temporal, ruta)
+
+
+def escribir_csv(df, ruta):
+    df[COLUMNAS].to_csv(ruta, index=False)
+
+
+def escribir_parquet(df, ruta):
+    from ingest import escribir_columnar, tabla_desde_dataframe
+
+    escribir_columnar(tabla_desde_dataframe(df), ruta)
+
+
+ESCRITORES = {"xlsx": escribir_xlsx, "csv": escribir_csv, "parquet": escribir_parquet}
+
+
+def _datos_comuna(cubo, codcom):
+    # DatosComuna leído directo de un cubo, sin el cubo del proceso ni Streamlit
+    from analisis import DatosComuna
+
+    annual_df, monthly_df, _ = cubo.tablas(codcom)
+    return DatosComuna(codcom, cubo.periodos(), annual_df, monthly_df, lambda delito, granularidad: cubo.matriz(codcom, delito, granularidad))
+
+
+def escenario_un_año(directorio):
+    """Un solo año con datos: las tablas traen el año anterior en cero y los análisis corren"""
+    import analisis
+    from cube import COLUMNAS_CUBO, compactar, construir_cubo
+    from ingest import leer_columnar
+
+    df = dataset_sintetico([1101, 1107], desde=datetime.date(2025, 1, 1), hasta=datetime.date(2025, 6, 30))
+    ruta = os.path.join(directorio, "un_año.parquet")
+    escribir_parquet(df, ruta)
+    cubo = construir_cubo(compactar(leer_columnar(ruta, COLUMNAS_CUBO, delito_categorico=True)))
+    periodos = cubo.periodos()
+    assert periodos.años == [2025] and periodos.anterior == 2024, periodos.años
+
+    annual_df, monthly_df, weekly_df = cubo.tablas(1101)
+    assert (annual_df[periodos.columna(2024)] == 0).all()
+    for tabla, columna in ((monthly_df, "Año"), (weekly_df, "año")):
+        anterior = tabla[tabla[columna] == 2024]
+        assert len(anterior) == len(annual_df) and not anterior.select_dtypes("number").drop(columns=columna).any().any()
+
+    datos = _datos_comuna(cubo, 1101)
+    analisis.resumen_general(datos)
+    assert analisis.metricas_clave(datos).total_anterior == 0
+    for delito in ["All"] + sorted(annual_df["Delito"].unique()):
+        analisis.resumen_anual(datos, delito)
+        analisis.resumen_mensual(datos, delito)
+        analisis.resumen_semanal(datos, delito)
+
+
+def escenario_incremental(directorio):
+    """Ingesta incremental contra reconstrucción completa: mismo archivo columnar (filas y orden
+    por codcom e id_semana) y mismas tablas; solo cambia la versión de las comunas tocadas"""
+    import ingest
+    from cube import COLUMNAS_CUBO, cargar_cubo, compactar, construir_cubo, guardar_cubo
+
+    df = dataset_sintetico([1101, 1107, 5101, 13101], desde=datetime.date(2024, 1, 1), hasta=datetime.date(2025, 3, 1))
+    ultima = df["id_semana"].max()
+    # El libro crece por semanas completas: las dos últimas semanas llegan después, 1107 no tiene
+    # filas en ellas y 5101 aparece recién en ellas
+    nuevas = df["id_semana"] >= ultima - 1
+    antes = df[~nuevas & (df["codcom"] != 5101)]
+    despues = df[(~nuevas & (df["codcom"] != 5101)) | (nuevas & (df["codcom"] != 1107))]
+    ruta_xlsx = os.path.join(directorio, "incremental.xlsx")
+    ruta_columnar = os.path.join(directorio, "incremental.parquet")
+    ruta_cubo = os.path.join(directorio, "incremental.cubo.npz")
+    ruta_completo = os.path.join(directorio, "completo.parquet")
+
+    def cubo_desde(ruta):
+        return construir_cubo(compactar(ingest.leer_columnar(ruta, COLUMNAS_CUBO, delito_categorico=True)))
+
+    # Row groups chicos, para que las comunas crucen de un row group al siguiente
+    filas_por_grupo, ingest.FILAS_POR_GRUPO = ingest.FILAS_POR_GRUPO, 1000
+    try:
+        escribir_xlsx(antes, ruta_xlsx)
+        ingest.convertir_xlsx(ruta_xlsx, ruta_columnar)
+        guardar_cubo(cubo_desde(ruta_columnar), ruta_cubo)
+        base = cargar_cubo(ruta_cubo)
+
+        escribir_xlsx(despues, ruta_xlsx)
+        cambiadas = ingest.ingerir_semanas_nuevas(ruta_xlsx, ruta_columnar, ruta_cubo)
+        ingest.convertir_xlsx(ruta_xlsx, ruta_completo)
+    finally:
+        ingest.FILAS_POR_GRUPO = filas_por_grupo
+    assert cambiadas == [1101, 5101, 13101], cambiadas
+
+    incremental, completo = ingest.leer_columnar(ruta_columnar), ingest.leer_columnar(ruta_completo)
+    pd.testing.assert_frame_equal(incremental, completo)
+    claves = incremental[["codcom", "id_semana"]].to_numpy()
+    assert (np.diff(claves[:, 0]) >= 0).all() and all((np.diff(claves[claves[:, 0] == c, 1]) >= 0).all() for c in np.unique(claves[:, 0]))
+
+    cubo, cubo_completo = cargar_cubo(ruta_cubo), cubo_desde(ruta_completo)
+    for codcom in [1101, 1107, 5101, 13101]:
+        for tabla, tabla_completa in zip(cubo.tablas(codcom), cubo_completo.tablas(codcom)):
+            pd.testing.assert_frame_equal(tabla, tabla_completa)
+    assert cubo.version(1107) == base.version(1107) and cubo.version(1101) != base.version(1101)
+
+
+ESCENARIOS = {"un_año": escenario_un_año, "incremental": escenario_incremental}
+
+
+def correr_escenarios(nombres):
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre in nombres:
+            ESCENARIOS[nombre](directorio)
+            print(f"{nombre}: ok")
+
+
+def main():
+    from data import comunas
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comunas", type=int, default=len(comunas), help="cantidad de comunas (de data.comunas)")
+    parser.add_argument("--delitos", type=int, default=len(TASAS_DELITO))
+    parser.add_argument("--desde", type=datetime.date.fromisoformat, default=datetime.date(2023, 1, 1))
+    parser.add_argument("--hasta", type=datetime.date.fromisoformat, default=datetime.date(2025, 8, 10))
+    parser.add_argument("--sesgo", type=float, default=1.0, help="exponente de Zipf entre comunas (0 = uniforme)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formatos", nargs="+", choices=sorted(ESCRITORES), default=["parquet"])
+    parser.add_argument("--salida", default="ESTADISTICA_DELITO_SINTETICO", help="ruta base, sin extensión")
+    parser.add_argument("--escenarios", nargs="*", choices=sorted(ESCENARIOS), help="verifica los escenarios indicados (todos si no se indica ninguno) en vez de escribir un dataset")
+    args = parser.parse_args()
+
+    if args.escenarios is not None:
+        correr_escenarios(args.escenarios or sorted(ESCENARIOS))
+        return
+
+    codcoms = list(comunas)[:args.comunas]
+    df = dataset_sintetico(codcoms, args.delitos, args.desde, args.hasta, args.sesgo, args.seed)
+    print(f"{len(df):,} filas, {len(codcoms)} comunas, {args.delitos} delitos, {args.desde} a {args.hasta}")
+    for formato in args.formatos:
+        ruta = f"{args.salida}.{formato}"
+        ESCRITORES[formato](df, ruta)
+        print(f"-> {ruta}")
+
+
+if __name__ == "__main__":
+    main()
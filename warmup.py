@@ -0,0 +1,102 @@
+"""Precalentamiento de cachés en segundo plano.
+
+Con DELITO_PRECALENTAR=all (todas las comunas) o una lista de codcom separada por comas,
+un hilo del proceso llena get_data_session, los tres gráficos y la tabla anual de "All" de
+cada comuna, para que el primer usuario de una comuna no pague el cache miss. El hilo arranca
+al importar el paquete dashboard, una vez por proceso; sus cargas no entran a los percentiles
+de carga de instrumentation, que son los de los usuarios.
+Con DELITO_PRECALENTAR_INTERVALO=<segundos> el recorrido se repite periódicamente, lo que
+vuelve a llenar las comunas que recibieron semanas nuevas en una ingesta incremental (todas,
+cuando cambian las etiquetas de los periodos: un año nuevo o el cierre del año actual).
+"""
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_hilo = None
+_lock = threading.Lock()
+
+
+def codcoms_desde_entorno():
+    """Comunas a precalentar según DELITO_PRECALENTAR: None si está desactivado"""
+    valor = os.environ.get("DELITO_PRECALENTAR", "").strip()
+    if not valor:
+        return None
+    if valor.lower() in ("all", "todas"):
+        from data import comunas
+
+        return list(comunas)
+    return [int(codcom) for codcom in valor.split(",") if codcom.strip()]
+
+
+def precalentar_comuna(CODCOM):
+    """Ejecuta los constructores cacheados de una comuna con las mismas claves que usan las páginas"""
+    from charts import (
+        clave_version,
+        get_data_session,
+        render_annual_chart,
+        render_monthly_chart,
+        render_weekly_chart,
+        tabla_anual,
+    )
+    from data import get_data
+
+    version = clave_version(CODCOM)
+    # Las tablas entran al caché de get_data_session sin pasar por ella: sin spinner (no hay
+    # página) y sin registrar_carga, que mide las cargas que esperan los usuarios
+    if not get_data_session.cacheado(CODCOM, version):
+        get_data_session.guardar(get_data(CODCOM), CODCOM, version)
+    render_annual_chart(CODCOM, version, "All")
+    render_monthly_chart(CODCOM, version, "All")
+    render_weekly_chart(CODCOM, version, "All")
+    tabla_anual(CODCOM, version, "All")
+
+
+def precalentar(codcoms):
+    """Recorre las comunas en orden; las que no tienen datos se omiten"""
+    t0 = time.perf_counter()
+    listas = 0
+    for CODCOM in codcoms:
+        try:
+            precalentar_comuna(CODCOM)
+        except ValueError:
+            continue
+        listas += 1
+    logger.info("Precalentadas %d de %d comunas en %.1f s", listas, len(codcoms), time.perf_counter() - t0)
+    return listas
+
+
+def _recorrer(codcoms, intervalo):
+    while True:
+        try:
+            precalentar(codcoms)
+        except Exception:
+            logger.exception("Falló el precalentamiento")
+        if not intervalo:
+            return
+        time.sleep(intervalo)
+
+
+def iniciar(codcoms, intervalo=None):
+    """Lanza el hilo de precalentamiento (uno por proceso; las llamadas siguientes no hacen nada)"""
+    global _hilo
+    with _lock:
+        if _hilo is not None:
+            return _hilo
+        _hilo = threading.Thread(target=_recorrer, args=(list(codcoms), intervalo), name="precalentar", daemon=True)
+        _hilo.start()
+    return _hilo
+
+
+def iniciar_desde_entorno():
+    """Lo llama el paquete dashboard al importarse: no bloquea y solo actúa si está configurado"""
+    if _hilo is not None:
+        return _hilo
+    codcoms = codcoms_desde_entorno()
+    if not codcoms:
+        return None
+    intervalo = float(os.environ.get("DELITO_PRECALENTAR_INTERVALO", 0)) or None
+    return iniciar(codcoms, intervalo)